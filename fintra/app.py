@@ -1,10 +1,20 @@
+import heapq
+import logging
+import logging.handlers
 import os
+import queue
+import random
+import re
+import signal
 import sys
 import threading
 import time
 import warnings
-from datetime import datetime, time as dt_time
-from typing import Any, List
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from rich.console import Console
@@ -16,20 +26,40 @@ from fintra.data import fetch_market_data, fetch_crypto_data, fetch_economy_data
 from fintra.plans import load_plans
 from fintra.provider import MassiveProvider
 from fintra.state import DashboardState
-from fintra.ui import build_layout, key_listener
-from fintra.websocket import start_ws_feeds, stop_ws_feeds
+from fintra.ui import build_layout, key_listener, refresh_clock
+from fintra.websocket import retarget_ws_feeds, start_ws_feeds, stop_ws_feeds
+
+# KEY=value lines in .env; comments and blank lines don't match
+_ENV_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
+class _TagFormatter(logging.Formatter):
+    """Formats records like the app's own console messages: "[warning] text"."""
+
+    # Tags that differ from the lowercased level name
+    _TAGS = {logging.INFO: "notice"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        tag = self._TAGS.get(record.levelno) or record.levelname.lower()
+        return f"[{tag}] {record.getMessage()}"
 
 
 def main():
+    # Show fintra's log records (config/watchlist problems) on the console
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_TagFormatter())
+    log = logging.getLogger("fintra")
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
     # Load .env file if present
     env_path = os.path.join(PROJECT_ROOT, ".env")
     if os.path.exists(env_path):
         with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, val = line.partition("=")
-                    os.environ.setdefault(key.strip(), val.strip())
+            content = f.read()
+        for key, val in _ENV_RE.findall(content):
+            os.environ.setdefault(key, val)
 
     # Validate API key
     api_key = os.environ.get("MASSIVE_API_KEY")
@@ -64,12 +94,15 @@ def main():
     plans = load_plans(provider)
     state = DashboardState()
     state.active_watchlist_name = os.path.basename(watchlist_files[watchlist_idx])
+    state.active_watchlist = watchlist
 
-    # Save original terminal settings before key listener changes them
-    _original_termios = None
+    # Exit-time cleanups, unwound in reverse: Live's screen first, then the
+    # original terminal settings (saved before the key listener changes them)
+    cleanup = ExitStack()
     try:
-        import termios as _termios
-        _original_termios = _termios.tcgetattr(sys.stdin.fileno())
+        import termios
+        fd = sys.stdin.fileno()
+        cleanup.callback(termios.tcsetattr, fd, termios.TCSADRAIN, termios.tcgetattr(fd))
     except Exception:
         pass
 
@@ -77,6 +110,25 @@ def main():
     listener = threading.Thread(target=key_listener, args=(state,), daemon=True)
     listener.start()
 
+    # Terminal resizes redraw immediately. The C-level signal handler writes to
+    # a pipe (async-signal-safe) and a reader thread bumps the state, so the
+    # main thread never takes a lock from inside a signal handler.
+    if hasattr(signal, "SIGWINCH"):
+        try:
+            resize_r, resize_w = os.pipe()
+            os.set_blocking(resize_w, False)
+            signal.signal(signal.SIGWINCH, lambda signum, frame: None)
+            signal.set_wakeup_fd(resize_w)
+
+            def _resize_watcher():
+                while os.read(resize_r, 64):
+                    state.bump()
+
+            threading.Thread(target=_resize_watcher, daemon=True).start()
+            cleanup.callback(signal.set_wakeup_fd, -1)
+        except (OSError, ValueError):
+            pass
+
     # Show dashboard immediately, populate data in background
     console = Console()
 
@@ -85,6 +137,10 @@ def main():
     was_open = False  # track market state transitions
     market_closed_at = None  # timestamp when market transitioned to closed
     DELAYED_GRACE = 15 * 60  # delayed feeds keep updating 15min after close
+    RENDER_DEBOUNCE = 0.1  # min seconds between rebuilds; coalesces bursts of WS updates
+    STATUS_INTERVAL = 300  # market status re-check; the bells are checked on time
+    MAX_BACKOFF = 300  # longest market poll interval while rate limited
+    STATUS_CONFIRM = 30  # re-check delay before acting on an open/close flip
 
     def _check_market_status():
         try:
@@ -93,6 +149,7 @@ def main():
             groups = status.get("indices_groups", {})
             if groups:
                 state.indices_group_status = groups
+            state.bump()
         except Exception:
             pass
 
@@ -102,14 +159,49 @@ def main():
     _MARKET_CLOSE = dt_time(16, 0)
     _AFTER_HOURS_CLOSE = dt_time(20, 0)
 
-    def _in_extended_hours() -> bool:
-        """True if current ET time is in pre-market or after-hours on a weekday."""
-        now_et = datetime.now(_ET)
+    @lru_cache(maxsize=1)
+    def _in_extended_hours(sec: int) -> bool:
+        """True if epoch second `sec` is in pre-market or after-hours on a weekday (ET).
+
+        Keyed on the whole second, so the loop's repeated checks within a second
+        reuse one timezone conversion.
+        """
+        now_et = datetime.fromtimestamp(sec, _ET)
         if now_et.weekday() >= 5:  # weekend
             return False
         t = now_et.time()
         return (_PRE_MARKET_OPEN <= t < _MARKET_OPEN) or (_MARKET_CLOSE <= t < _AFTER_HOURS_CLOSE)
 
+    def _secs_to_next_bell() -> float:
+        """Seconds until the next weekday 9:30 or 16:00 ET (holidays not excluded)."""
+        now_et = datetime.now(_ET)
+        for days in range(8):
+            day = now_et.date() + timedelta(days=days)
+            if day.weekday() >= 5:
+                continue
+            for bell_time in (_MARKET_OPEN, _MARKET_CLOSE):
+                bell = datetime.combine(day, bell_time, tzinfo=_ET)
+                if bell > now_et:
+                    return (bell - now_et).total_seconds()
+        return STATUS_INTERVAL
+
+    def _next_status_check(now: float) -> float:
+        """Monotonic deadline for the next status check: STATUS_INTERVAL from now,
+        or a few seconds after the next open/close bell if that comes first."""
+        return now + min(STATUS_INTERVAL, _secs_to_next_bell() + 5)
+
+    def _next_refresh() -> float:
+        """Poll interval after a market fetch: the configured interval times
+        `state.rate_limit_backoff`, which doubles per rate-limited poll (capped at
+        MAX_BACKOFF seconds) and decays by 0.8x per successful one. Rate-limited
+        intervals are jittered down by up to a quarter so retries don't land in step."""
+        base = config.refresh_interval
+        if state.rate_limited:
+            state.rate_limit_backoff = min(state.rate_limit_backoff * 2, max(1.0, MAX_BACKOFF / base))
+            return base * state.rate_limit_backoff * random.uniform(0.75, 1.0)
+        state.rate_limit_backoff = max(1.0, state.rate_limit_backoff * 0.8)
+        return base * state.rate_limit_backoff
+
     def _all_realtime():
         """True if all entitled feeds are real-time (no delayed grace needed)."""
         has_stocks = bool(watchlist["equities"])
@@ -120,178 +212,320 @@ def main():
 
     # Kick off all data fetches in background threads
     def _init_market():
-        nonlocal ws_feeds, was_open
+        # Runs on fetch_pool. The initial market fetch goes through
+        # _request_market_fetch, and WS feeds are started once this finishes,
+        # both on the main thread, which owns ws_feeds / was_open
         _check_market_status()
-        # Always do initial fetch to populate data regardless of market status
-        fetch_market_data(provider, watchlist, state, plans)
         fetch_crypto_data(provider, watchlist, state, plans)
-        if state.market_is_open:
-            ws_feeds = start_ws_feeds(provider, watchlist, state, plans)
-            was_open = True
 
-    threading.Thread(target=_init_market, daemon=True).start()
-    threading.Thread(target=fetch_economy_data, args=(provider, state), daemon=True).start()
+    # Shared pool for one-off startup/switch fetches, market polls and status
+    # checks, so they run concurrently without spawning a thread per request
+    fetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fintra-poll")
+
+    # Long-lived workers for crypto and economy refreshes, woken by events
+    # instead of spawning a thread per fetch
+    crypto_wakeup = threading.Event()
+    economy_wakeup = threading.Event()
+
+    def _crypto_worker():
+        while True:
+            crypto_wakeup.wait()
+            crypto_wakeup.clear()
+            if state.quit_flag:
+                return
+            try:
+                fetch_crypto_data(provider, watchlist, state, plans)
+            except Exception:
+                pass
+
+    def _economy_worker():
+        # Fetches immediately, then every economy_interval or when woken early
+        while not state.quit_flag:
+            try:
+                fetch_economy_data(provider, state)
+            except Exception:
+                pass
+            economy_wakeup.wait(timeout=config.economy_interval)
+            economy_wakeup.clear()
+
+    init_future = fetch_pool.submit(_init_market)
+    threading.Thread(target=_crypto_worker, daemon=True).start()
+    threading.Thread(target=_economy_worker, daemon=True).start()
 
     # Fetch YTD reference prices if any column config uses ytd%
     needs_ytd = "ytd%" in config.equity_cols or "ytd%" in config.index_cols
     needs_mktcap = "mktcap" in config.equity_cols
-    if needs_ytd or needs_mktcap:
-        def _deferred_fetches():
+    deferred_wakeup = threading.Event()
+
+    def _deferred_worker():
+        # Runs on its own thread rather than fetch_pool, since it parks on
+        # economy_done (set on exit too, to release the wait)
+        while True:
+            deferred_wakeup.wait()
             # Wait for economy data to finish first to avoid rate limit contention
-            while not state.economy_updated and not state.quit_flag:
-                time.sleep(1)
-            if needs_ytd:
-                fetch_ytd_closes(provider, watchlist, state)
-            if needs_mktcap:
-                fetch_ticker_details(provider, watchlist, state)
-        threading.Thread(target=_deferred_fetches, daemon=True).start()
-
-    last_market_fetch = time.time()
-    last_economy_fetch = time.time()
-    last_status_check = time.time()
-    last_crypto_fetch = time.time()
+            state.economy_done.wait()
+            # Switches made while waiting collapse into this one run
+            deferred_wakeup.clear()
+            if state.quit_flag:
+                return
+            wl = watchlist
+            try:
+                if needs_ytd:
+                    fetch_ytd_closes(provider, wl, state, plans)
+                # Skip the rest if the watchlist was switched meanwhile; the
+                # switch has queued a run for the new one
+                if needs_mktcap and wl is watchlist:
+                    fetch_ticker_details(provider, wl, state, plans)
+            except Exception:
+                pass
+
+    if needs_ytd or needs_mktcap:
+        threading.Thread(target=_deferred_worker, daemon=True).start()
+        deferred_wakeup.set()
+
+    # Periodic tasks ("market", "crypto", "status") run off a min-heap of
+    # (deadline, task); `deadlines` holds each task's current deadline, so a
+    # reschedule just pushes a new entry and the superseded one is skipped when
+    # popped. Deadlines use the monotonic clock so wall-clock jumps (NTP, suspend)
+    # can't trigger bursts of re-fetches or stall polling; time.time() is kept
+    # for displayed times and flash expiry
+    schedule: List[Tuple[float, str]] = []
+    deadlines: Dict[str, float] = {}
+
+    def _schedule(task: str, at: float) -> None:
+        deadlines[task] = at
+        heapq.heappush(schedule, (at, task))
+
+    status_check = None  # pending market status future
+    pending_open: Optional[bool] = None  # open/close flip seen once, awaiting a confirming check
+    market_poll = None  # pending market fetch future (periodic poll or transition refresh)
+    market_refetch = False  # the pending market fetch is for a switched-away watchlist
+
+    def _has_market() -> bool:
+        return bool(watchlist["equities"] or watchlist["indices"])
+
+    def _request_market_fetch():
+        # At most one market fetch queued or running; later requests ride on it.
+        # Crypto-only watchlists have nothing to fetch
+        nonlocal market_poll
+        if market_poll is None and _has_market():
+            market_poll = fetch_pool.submit(fetch_market_data, provider, watchlist, state, plans)
 
     effective_refresh = config.refresh_interval
 
+    def _crypto_interval() -> float:
+        # Starter plan polls at the refresh interval, basic hourly (data is daily)
+        return effective_refresh if plans.currencies_has_snapshots else 3600
+
+    start = time.monotonic()
+    _schedule("market", start + effective_refresh)
+    _schedule("crypto", start + _crypto_interval())
+    _schedule("status", _next_status_check(start))
+    # Always do initial fetch to populate data regardless of market status
+    _request_market_fetch()
+
+    # Redraws are driven by state.version rather than a fixed-rate refresh thread
+    last_version = state.version
+    last_built = last_second = time.time()
+    layout = build_layout(state.snapshot(), watchlist, config, plans, last_built)
+
+    # While Live holds the alternate screen, log records (e.g. watchlist warnings
+    # on a switch) are held back instead of written over the dashboard, and are
+    # printed once the screen has been restored
+    held_logs: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    held_handler = logging.handlers.QueueHandler(held_logs)
+
+    def _release_logs():
+        log.removeHandler(held_handler)
+        log.addHandler(handler)
+        while not held_logs.empty():
+            handler.handle(held_logs.get())
+
+    log.removeHandler(handler)
+    log.addHandler(held_handler)
+    cleanup.callback(_release_logs)
+
     try:
-        with Live(build_layout(state, watchlist, config, plans), console=console, screen=True, refresh_per_second=2) as live:
-            while not state.quit_flag:
-                now = time.time()
-
-                # Handle watchlist switch
-                if state.switch_watchlist:
-                    state.switch_watchlist = False
-                    watchlist_files = list_watchlists()
-                    if len(watchlist_files) > 1:
-                        watchlist_idx = (watchlist_idx + 1) % len(watchlist_files)
-                    elif len(watchlist_files) == 1:
-                        watchlist_idx = 0
-                    else:
-                        state.watchlist_error = "No valid watchlist files"
-                    if watchlist_files:
-                        new_path = watchlist_files[watchlist_idx]
-                        try:
-                            new_wl = parse_watchlist(new_path)
-                            new_total = len(new_wl["equities"]) + len(new_wl["crypto"]) + len(new_wl["indices"])
-                            if new_total == 0:
-                                state.watchlist_error = f"{os.path.basename(new_path)}: no tickers"
-                            else:
-                                # Stop existing WS feeds
-                                stop_ws_feeds(ws_feeds)
-                                ws_feeds = []
+        live = cleanup.enter_context(Live(layout, console=console, screen=True, auto_refresh=False))
+        while not state.quit_flag:
+            now = time.monotonic()
+
+            # Handle watchlist switch
+            if state.switch_watchlist:
+                state.switch_watchlist = False
+                watchlist_files = list_watchlists()
+                if len(watchlist_files) > 1:
+                    watchlist_idx = (watchlist_idx + 1) % len(watchlist_files)
+                elif len(watchlist_files) == 1:
+                    watchlist_idx = 0
+                else:
+                    state.watchlist_error = "No valid watchlist files"
+                if watchlist_files:
+                    new_path = watchlist_files[watchlist_idx]
+                    try:
+                        new_wl = parse_watchlist(new_path)
+                        new_total = len(new_wl["equities"]) + len(new_wl["crypto"]) + len(new_wl["indices"])
+                        if new_total == 0:
+                            state.watchlist_error = f"{os.path.basename(new_path)}: no tickers"
+                        else:
+                            # Point open WS feeds at the new tickers instead of reconnecting;
+                            # with none left running, _init_market starts them if open
+                            ws_feeds = retarget_ws_feeds(ws_feeds, provider, new_wl, state, plans)
+                            if not ws_feeds:
                                 was_open = False
                                 market_closed_at = None
-                                # Reset state data
-                                state.equities = []
-                                state.crypto = []
-                                state.indices = []
-                                state.treasury = {}
-                                state.labor = {}
-                                state.inflation = {}
-                                state.prev_closes = {}
-                                state.ytd_closes = {}
-                                state.ticker_details = {}
-                                state.market_updated = None
-                                state.crypto_updated = None
-                                state.crypto_data_date = None
-                                state.economy_updated = None
-                                state.market_stale = False
-                                state.economy_stale = False
-                                state.market_error = ""
-                                state.economy_error = ""
-                                state.ws_connected = False
-                                state.watchlist_error = ""
-                                # Swap watchlist
-                                watchlist = new_wl
-                                state.active_watchlist_name = os.path.basename(new_path)
-                                # Re-kick data fetches
-                                threading.Thread(target=_init_market, daemon=True).start()
-                                threading.Thread(target=fetch_economy_data, args=(provider, state), daemon=True).start()
-                                if needs_ytd or needs_mktcap:
-                                    threading.Thread(target=_deferred_fetches, daemon=True).start()
-                                last_market_fetch = now
-                                last_economy_fetch = now
-                                last_status_check = now
-                                last_crypto_fetch = now
-                        except Exception as e:
-                            state.watchlist_error = f"{os.path.basename(new_path)}: {e}"
-
-                # Check market status every 60s
-                if now - last_status_check >= 60:
-                    _check_market_status()
-                    last_status_check = now
-
-                    # Handle market open/close transitions
-                    if state.market_is_open and not was_open:
-                        # Market just opened — reconnect WS and do an initial fetch
-                        market_closed_at = None
-                        ws_feeds = start_ws_feeds(provider, watchlist, state, plans)
-                        threading.Thread(target=fetch_market_data, args=(provider, watchlist, state, plans), daemon=True).start()
-                        threading.Thread(target=fetch_crypto_data, args=(provider, watchlist, state, plans), daemon=True).start()
-                        last_market_fetch = now
-                        last_crypto_fetch = now
-                        was_open = True
-                    elif not state.market_is_open and was_open and market_closed_at is None:
-                        # Market just closed
-                        threading.Thread(target=fetch_market_data, args=(provider, watchlist, state, plans), daemon=True).start()
-                        if _all_realtime():
-                            # Real-time feeds: stop immediately
-                            stop_ws_feeds(ws_feeds)
-                            ws_feeds = []
-                            was_open = False
-                        else:
-                            # Delayed feeds: keep running for 15 more minutes
-                            market_closed_at = now
-
-                # Expire delayed grace period
-                if market_closed_at is not None and now - market_closed_at >= DELAYED_GRACE:
-                    stop_ws_feeds(ws_feeds)
-                    ws_feeds = []
-                    threading.Thread(target=fetch_market_data, args=(provider, watchlist, state, plans), daemon=True).start()
-                    was_open = False
+                                pending_open = None
+                            # Reset state data
+                            state.reset_watchlist(os.path.basename(new_path), new_wl)
+                            # Swap watchlist
+                            watchlist = new_wl
+                            # Re-kick data fetches. A market fetch still running for the
+                            # old watchlist drops its rows; fetch again once it finishes
+                            init_future = fetch_pool.submit(_init_market)
+                            if market_poll is None:
+                                _request_market_fetch()
+                            else:
+                                market_refetch = True
+                            economy_wakeup.set()
+                            deferred_wakeup.set()
+                            _schedule("market", now + effective_refresh)
+                            _schedule("crypto", now + _crypto_interval())
+                            _schedule("status", _next_status_check(now))
+                    except Exception as e:
+                        state.watchlist_error = f"{os.path.basename(new_path)}: {e}"
+                state.bump()
+
+            # First status check of this watchlist landed: start WS feeds if open
+            if init_future is not None and init_future.done():
+                init_future = None
+                if state.market_is_open and not ws_feeds:
+                    ws_feeds = start_ws_feeds(provider, watchlist, state, plans)
+                    was_open = True
+
+            # Handle market open/close transitions once the status check lands. A flip
+            # is acted on only when a second check STATUS_CONFIRM later agrees, so a
+            # status endpoint flickering around the bells doesn't churn WS connections
+            if status_check is not None and status_check.done():
+                status_check = None
+                is_open = state.market_is_open
+                flipped = (is_open and not was_open) or (not is_open and was_open and market_closed_at is None)
+                if not flipped:
+                    pending_open = None
+                elif pending_open != is_open:
+                    # First sighting: confirm with another check before acting
+                    pending_open = is_open
+                    _schedule("status", now + STATUS_CONFIRM)
+                elif is_open:
+                    # Market just opened — reconnect WS and do an initial fetch
+                    pending_open = None
                     market_closed_at = None
-
-                # Adjust refresh rate when rate-limited
-                if state.rate_limited:
-                    effective_refresh = min(config.refresh_interval * 4, 120)
+                    ws_feeds = start_ws_feeds(provider, watchlist, state, plans)
+                    _request_market_fetch()
+                    if watchlist["crypto"]:
+                        crypto_wakeup.set()
+                    _schedule("crypto", now + _crypto_interval())
+                    was_open = True
                 else:
-                    effective_refresh = config.refresh_interval
-
-                # Equities/indices: active when market open, in delayed grace, or extended hours
-                ext_hours = _in_extended_hours()
+                    # Market just closed
+                    pending_open = None
+                    _request_market_fetch()
+                    if _all_realtime():
+                        # Real-time feeds: stop immediately
+                        stop_ws_feeds(ws_feeds)
+                        ws_feeds = []
+                        was_open = False
+                    else:
+                        # Delayed feeds: keep running for 15 more minutes
+                        market_closed_at = now
+
+            # Expire delayed grace period
+            if market_closed_at is not None and now - market_closed_at >= DELAYED_GRACE:
+                stop_ws_feeds(ws_feeds)
+                ws_feeds = []
+                _request_market_fetch()
+                was_open = False
+                market_closed_at = None
+
+            # Equities/indices: active when market open, in delayed grace, or extended hours
+            ext_hours = _in_extended_hours(int(time.time()))
+            if ext_hours != state.extended_hours:
                 state.extended_hours = ext_hours
-                eq_active = state.market_is_open or market_closed_at is not None or ext_hours
-                if eq_active:
-                    if now - last_market_fetch >= effective_refresh:
-                        threading.Thread(target=fetch_market_data, args=(provider, watchlist, state, plans), daemon=True).start()
-                        last_market_fetch = now
-
-                # Crypto: starter plan polls at refresh interval, basic hourly (data is daily)
-                crypto_interval = effective_refresh if plans.currencies_has_snapshots else 3600
-                if plans.currencies_has_snapshots or eq_active:
-                    if now - last_crypto_fetch >= crypto_interval:
-                        threading.Thread(target=fetch_crypto_data, args=(provider, watchlist, state, plans), daemon=True).start()
-                        last_crypto_fetch = now
-
-                # Economy data refresh (independent of market hours)
-                if now - last_economy_fetch >= config.economy_interval:
-                    threading.Thread(target=fetch_economy_data, args=(provider, state), daemon=True).start()
-                    last_economy_fetch = now
-
-                live.update(build_layout(state, watchlist, config, plans))
-                time.sleep(0.5)
+                state.bump()
+            eq_active = state.market_is_open or market_closed_at is not None or ext_hours
+
+            # Each finished poll's outcome sets the interval until the next one,
+            # counted from when it finished
+            if market_poll is not None and market_poll.done():
+                market_poll = None
+                if market_refetch:
+                    market_refetch = False
+                    _request_market_fetch()
+                else:
+                    effective_refresh = _next_refresh()
+                    _schedule("market", now + effective_refresh)
+
+            # Run due periodic tasks; a task whose feed is idle re-checks in a second
+            while schedule[0][0] <= now:
+                at, task = heapq.heappop(schedule)
+                if deadlines[task] != at:
+                    continue  # superseded by a later reschedule
+                if task == "status":
+                    # Every 5 min and just after each bell, off the render thread
+                    if status_check is None:
+                        status_check = fetch_pool.submit(_check_market_status)
+                    _schedule("status", _next_status_check(now))
+                elif task == "market":
+                    # Equities/indices poll while active; the poll's completion
+                    # schedules the next one
+                    if not eq_active or not _has_market():
+                        _schedule("market", now + 1)
+                    elif market_poll is None:
+                        _request_market_fetch()
+                elif task == "crypto":
+                    if watchlist["crypto"] and (plans.currencies_has_snapshots or eq_active):
+                        crypto_wakeup.set()
+                        _schedule("crypto", now + _crypto_interval())
+                    else:
+                        _schedule("crypto", now + 1)
+
+            # Rebuild only when displayed data changed (or a row flash just expired),
+            # at most once per RENDER_DEBOUNCE; otherwise just tick the clock regions
+            # once per second
+            frame_time = time.time()  # fresh read: the checks above may have blocked
+            snap = state.snapshot()
+            pending = snap.version != last_version or last_built < snap.flash_until <= frame_time
+            if pending and frame_time - last_built >= RENDER_DEBOUNCE:
+                layout = build_layout(snap, watchlist, config, plans, frame_time)
+                live.update(layout, refresh=True)
+                last_version = snap.version
+                last_built = frame_time
+                last_second = int(frame_time)
+                pending = False
+            elif int(frame_time) != last_second:
+                refresh_clock(layout, snap, config, plans, frame_time)
+                live.refresh()
+                last_second = int(frame_time)
+
+            # Sleep until a fetcher/feed marks the state dirty, the next wall-clock
+            # second (header clock), the next task deadline, or a debounced rebuild is due
+            timeout = min(1.0 - time.time() % 1.0, schedule[0][0] - time.monotonic())
+            if pending:
+                timeout = min(timeout, last_built + RENDER_DEBOUNCE - time.time())
+            state.dirty.wait(timeout=max(timeout, 0.0))
+            state.dirty.clear()
 
     except KeyboardInterrupt:
         pass
     finally:
         state.quit_flag = True
+        crypto_wakeup.set()
+        economy_wakeup.set()
+        deferred_wakeup.set()
+        state.economy_done.set()
         stop_ws_feeds(ws_feeds)
-        # Restore original terminal settings
-        if _original_termios:
-            try:
-                import termios as _termios
-                _termios.tcsetattr(sys.stdin.fileno(), _termios.TCSADRAIN, _original_termios)
-            except Exception:
-                pass
-        console.clear()
+        fetch_pool.shutdown(wait=False, cancel_futures=True)
+        # Leaves the alternate screen and restores the terminal; the shell's
+        # scrollback is left as it was
+        cleanup.close()
+        console.show_cursor(True)
         print("[fintra] Goodbye.")
@@ -1,145 +1,279 @@
-import configparser
+import logging
 import os
 import re
+import stat
 import sys
-from dataclasses import dataclass, field
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Tuple
 
 from fintra.constants import (
     CONFIG_PATH, WATCHLISTS_DIR, DEFAULT_WATCHLIST,
     DEFAULT_REFRESH, DEFAULT_ECONOMY,
-    EQUITY_COLUMNS, INDEX_COLUMNS, CRYPTO_COLUMNS,
+    EQUITY_COLUMN_KEYS, INDEX_COLUMN_KEYS, CRYPTO_COLUMN_KEYS,
     DEFAULT_EQUITY_COLS, DEFAULT_INDEX_COLS, DEFAULT_CRYPTO_COLS,
 )
 
 
+# Parse problems go through logging so callers decide where (and whether) they show;
+# app.main() prints them as "[level] message" before the dashboard starts
+_log = logging.getLogger(__name__)
+
+_MULTIPLIERS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
 def parse_interval(value: str, default: int) -> int:
-    """Convert interval string like '10s', '1m', '5m', '1h', '1d' to seconds."""
+    """Convert interval string like '10s', '1m', '5m', '1h', '1d' to seconds.
+
+    A number, optional whitespace, then one unit letter; parsed by hand since the
+    grammar is too small to be worth a regex match.
+    """
     value = value.strip().lower()
-    m = re.match(r"^(\d+)\s*(s|m|h|d)$", value)
-    if not m:
-        print(f"[warning] Invalid interval '{value}', using {default}s")
+    num = value[:-1].rstrip()
+    if not num.isdecimal() or value[-1] not in _MULTIPLIERS:
+        _log.warning("Invalid interval %r, using %ds", value, default)
         return default
-    num, unit = int(m.group(1)), m.group(2)
-    multipliers = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-    return num * multipliers[unit]
+    return int(num) * _MULTIPLIERS[value[-1]]
+
+
+# __slots__ via dataclass is 3.10+; older interpreters fall back to a plain dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Config:
+    """Dashboard settings from config.ini; immutable, so the cached instance is shared."""
+
     refresh_interval: int = DEFAULT_REFRESH
     economy_interval: int = DEFAULT_ECONOMY
-    equity_cols: List[str] = field(default_factory=lambda: list(DEFAULT_EQUITY_COLS))
-    index_cols: List[str] = field(default_factory=lambda: list(DEFAULT_INDEX_COLS))
-    crypto_cols: List[str] = field(default_factory=lambda: list(DEFAULT_CRYPTO_COLS))
+    equity_cols: Tuple[str, ...] = DEFAULT_EQUITY_COLS
+    index_cols: Tuple[str, ...] = DEFAULT_INDEX_COLS
+    crypto_cols: Tuple[str, ...] = DEFAULT_CRYPTO_COLS
 
 
-def _parse_col_list(value: str, available: dict, default: List[str]) -> List[str]:
-    """Parse a comma-separated column list, validating against available columns.
+def _parse_col_list(value: str, available: FrozenSet[str],
+                    default: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Parse a comma-separated column list, validating against available column keys.
 
-    'symbol' and 'name' are silently stripped — symbol is always prepended by the UI.
+    'symbol' and 'name' are silently stripped (they aren't column keys) — symbol is
+    always prepended by the UI. Blank and unknown entries are dropped, and a repeated
+    column keeps only its first position.
     """
-    cols = [c.strip().lower() for c in value.split(",") if c.strip()]
-    valid = [c for c in cols if c in available and c not in ("symbol", "name")]
+    valid = tuple(dict.fromkeys(c for c in map(str.strip, value.lower().split(",")) if c in available))
     return valid if valid else default
 
 
+def _read_file(path: str, limit: int = -1) -> bytes:
+    """Read a small file (or its first `limit` bytes) with one os.read sized by fstat.
+
+    Config and watchlist files are a few KB, so Python's buffered/text layers
+    would only add copies.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size if limit < 0 else min(size, limit))
+    finally:
+        os.close(fd)
+
+
+# Minimal INI grammar: [section] headers and key = value / key: value pairs (split at
+# the first delimiter, as configparser does); anything else is ignored
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]\s*$")
+_KV_RE = re.compile(r"^([^=:;#]+?)\s*[=:]\s*(.*?)\s*$")
+
+
+def _read_ini(path: str) -> Dict[str, Dict[str, str]]:
+    """Parse a simple INI file into {section: {key: value}} in a single pass.
+
+    Keys are lowercased like configparser's default; comment lines (# or ;) never match.
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current = None
+    lines = _read_file(path).decode("utf-8", "replace").splitlines()
+    for line in lines:
+        line = line.strip()
+        m = _SECTION_RE.match(line)
+        if m:
+            current = sections.setdefault(m.group(1), {})
+            continue
+        if current is None:
+            continue
+        m = _KV_RE.match(line)
+        if m:
+            current[m.group(1).lower()] = m.group(2)
+    return sections
+
+
+# Parsed config keyed on (st_mtime_ns, size) of config.ini — reparse only when the file changes
+_config_cache: Dict[Tuple[int, int], Config] = {}
+
+
 def parse_config() -> Config:
-    """Read config.ini and return a Config object."""
-    cfg_obj = Config()
-    if not os.path.exists(CONFIG_PATH):
-        print("[notice] config.ini not found, using defaults")
-        return cfg_obj
-
-    cfg = configparser.RawConfigParser()
-    cfg.read(CONFIG_PATH)
-    sect = cfg["dashboard"] if "dashboard" in cfg else {}
-    cfg_obj.refresh_interval = parse_interval(sect.get("refresh_interval", "10s"), DEFAULT_REFRESH)
-    cfg_obj.economy_interval = parse_interval(sect.get("economy_interval", "1d"), DEFAULT_ECONOMY)
-
-    if "equities_columns" in sect:
-        cfg_obj.equity_cols = _parse_col_list(sect["equities_columns"], EQUITY_COLUMNS, DEFAULT_EQUITY_COLS)
-    if "indices_columns" in sect:
-        cfg_obj.index_cols = _parse_col_list(sect["indices_columns"], INDEX_COLUMNS, DEFAULT_INDEX_COLS)
-    if "crypto_columns" in sect:
-        cfg_obj.crypto_cols = _parse_col_list(sect["crypto_columns"], CRYPTO_COLUMNS, DEFAULT_CRYPTO_COLS)
+    """Read config.ini and return a Config object.
 
+    Results are cached on the file's (st_mtime_ns, size), so repeated calls are free
+    until config.ini is edited.
+    """
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        _log.info("config.ini not found, using defaults")
+        return Config()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        sect = _read_ini(CONFIG_PATH).get("dashboard", {})
+    except OSError as e:
+        # Unreadable (permissions, a directory, ...): configparser skipped these too
+        _log.warning("Could not read config.ini (%s), using defaults", e.strerror or e)
+        return Config()
+    # A missing column key parses as an empty list, which falls back to the default
+    cfg_obj = Config(
+        refresh_interval=parse_interval(sect.get("refresh_interval", "10s"), DEFAULT_REFRESH),
+        economy_interval=parse_interval(sect.get("economy_interval", "1d"), DEFAULT_ECONOMY),
+        equity_cols=_parse_col_list(sect.get("equities_columns", ""), EQUITY_COLUMN_KEYS, DEFAULT_EQUITY_COLS),
+        index_cols=_parse_col_list(sect.get("indices_columns", ""), INDEX_COLUMN_KEYS, DEFAULT_INDEX_COLS),
+        crypto_cols=_parse_col_list(sect.get("crypto_columns", ""), CRYPTO_COLUMN_KEYS, DEFAULT_CRYPTO_COLS),
+    )
+
+    _config_cache.clear()
+    _config_cache[key] = cfg_obj
     return cfg_obj
 
 
-VALID_SECTIONS = {"equities", "crypto", "indices", "treasury", "economy"}
+VALID_SECTIONS = frozenset({"equities", "crypto", "indices", "treasury", "economy"})
+
 
+# Parsed watchlists: path → ((st_mtime_ns, size), result); switching back to a list is free
+_watchlist_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, tuple]]] = {}
 
-def parse_watchlist(path: str = "") -> Dict[str, List[str]]:
+
+def parse_watchlist(path: str = "") -> Dict[str, tuple]:
     """Parse a watchlist file into {equities: [], crypto: [], indices: [], treasury: [], economy: []}.
 
     Within [equities], lines starting with '## ' define named sub-groups.
-    The result includes an 'equity_groups' key: list of (name, [tickers]) tuples.
-    The flat 'equities' list always contains every ticker regardless of grouping.
+    The result includes an 'equity_groups' key: tuple of (name, (tickers...)) pairs.
+    The flat 'equities' tuple always contains every ticker regardless of grouping.
+    Sections are tuples, so the result (cached per path on the file's (st_mtime_ns, size))
+    can be shared safely.
     """
     if not path:
         path = os.path.join(WATCHLISTS_DIR, DEFAULT_WATCHLIST)
+    try:
+        st = os.stat(path)
+    except OSError:
+        _log.error("%s not found", path)
+        sys.exit(1)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _watchlist_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
     result: Dict[str, List[str]] = {
         "equities": [], "crypto": [], "indices": [], "treasury": [], "economy": [],
         "equity_groups": [],
     }
-    if not os.path.exists(path):
-        print(f"[error] {path} not found")
-        sys.exit(1)
+    # One raw read and one decode (splitlines handles \r\n); stray bad bytes can't
+    # abort parsing
+    content = _read_file(path).decode("utf-8", "replace")
 
-    current_section = None
-    current_group = None  # mutable: (name, [tickers])
-    with open(path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            # Detect equity group headers before generic comment skip
-            if line.startswith("## ") and current_section == "equities":
+    # Lowercased header line → the section list it selects
+    headers = {f"[{name}]": result[name] for name in VALID_SECTIONS}
+    equities = result["equities"]
+    groups = result["equity_groups"]
+
+    current_list = None  # list of the current section, bound once per header
+    current_group = None  # mutable: (name, [tickers]); only ever set within [equities]
+    # Lines are classified by their first character: comment/group, [section], ticker
+    for line in content.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        first = line[0]
+        if first == "#":
+            # '## name' starts an equity group; it's an ordinary comment elsewhere
+            if current_list is equities and line.startswith("## "):
                 group_name = line[3:].strip()
                 if group_name:
                     current_group = (group_name, [])
-                    result["equity_groups"].append(current_group)
-                continue
-            if line.startswith("#"):
-                continue
-            if line.startswith("[") and line.endswith("]"):
-                section = line[1:-1].lower()
-                if section in VALID_SECTIONS:
-                    current_section = section
-                    if section != "equities":
-                        current_group = None
-                continue
-            if current_section:
-                result[current_section].append(line)
-                if current_section == "equities" and current_group is not None:
-                    current_group[1].append(line)
-    return result
+                    groups.append(current_group)
+            continue
+        if first == "[" and line[-1] == "]":
+            section_list = headers.get(line.lower())
+            if section_list is not None:
+                current_list = section_list
+                if section_list is not equities:
+                    current_group = None
+            continue
+        if current_list is not None:
+            ticker = sys.intern(line)
+            current_list.append(ticker)
+            if current_group is not None:
+                current_group[1].append(ticker)
+    # Freeze: sections become tuples, groups (name, (tickers...)) pairs
+    frozen: Dict[str, tuple] = {k: tuple(v) for k, v in result.items()}
+    frozen["equity_groups"] = tuple((name, tuple(tickers)) for name, tickers in result["equity_groups"])
+    _watchlist_cache[path] = (key, frozen)
+    return frozen
+
+
+# validate_watchlist only looks at the start of a file: real watchlists open with
+# a header, and a stray large file (a log, say) shouldn't be read in full
+_VALIDATE_PEEK = 4096
+_VALID_HEADERS = frozenset(b"[" + s.encode() + b"]" for s in VALID_SECTIONS)
 
 
 def validate_watchlist(path: str) -> bool:
-    """Quick check that a file has at least one recognized [section] header."""
+    """Quick check that a file has a recognized [section] header in its first 4 KiB."""
     try:
-        with open(path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("[") and line.endswith("]"):
-                    if line[1:-1].lower() in VALID_SECTIONS:
-                        return True
+        head = _read_file(path, _VALIDATE_PEEK)
     except OSError:
         return False
-    return False
+    return any(line.strip().lower() in _VALID_HEADERS for line in head.splitlines())
+
+
+# Directory listing keyed on the dir's st_mtime_ns (changes when files are added,
+# removed or renamed); per-file validity keyed on each file's (st_mtime_ns, size)
+_listing_cache: Tuple[int, List[str]] = (-1, [])
+_valid_cache: Dict[str, Tuple[Tuple[int, int], bool]] = {}
 
 
 def list_watchlists() -> List[str]:
-    """Scan WATCHLISTS_DIR for valid .txt watchlist files. Returns sorted absolute paths."""
-    if not os.path.isdir(WATCHLISTS_DIR):
+    """Scan WATCHLISTS_DIR for valid .txt watchlist files. Returns sorted absolute paths.
+
+    Only re-lists the directory when it changes, and only re-validates files whose
+    mtime or size changed, so pressing 'l' repeatedly is cheap.
+    """
+    global _listing_cache
+    try:
+        dir_st = os.stat(WATCHLISTS_DIR)
+    except OSError:
         return []
+    if not stat.S_ISDIR(dir_st.st_mode):
+        return []
+    if _listing_cache[0] != dir_st.st_mtime_ns:
+        # scandir's entries carry the file type, so filtering needs no stat per name
+        try:
+            with os.scandir(WATCHLISTS_DIR) as it:
+                names = sorted(e.name for e in it if e.name.endswith(".txt") and e.is_file())
+        except OSError:
+            return []
+        _listing_cache = (dir_st.st_mtime_ns, names)
     paths = []
-    for name in sorted(os.listdir(WATCHLISTS_DIR)):
-        if not name.endswith(".txt"):
-            continue
+    for name in _listing_cache[1]:
         full = os.path.join(WATCHLISTS_DIR, name)
-        if os.path.isfile(full) and validate_watchlist(full):
+        try:
+            st = os.stat(full)
+        except OSError:
+            continue
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _valid_cache.get(full)
+        if cached is None or cached[0] != key:
+            cached = (key, validate_watchlist(full))
+            _valid_cache[full] = cached
+        if cached[1]:
             paths.append(full)
     return paths
@@ -1,4 +1,6 @@
 import os
+import sys
+from types import MappingProxyType
 
 # Project root: parent of the fintra/ package directory
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -24,7 +26,7 @@ ALL_YIELD_FIELDS = {
 }
 
 # Default order when no [treasury] section in watchlist
-DEFAULT_YIELD_KEYS = ["1M", "3M", "1Y", "2Y", "5Y", "10Y", "30Y"]
+DEFAULT_YIELD_KEYS = ("1M", "3M", "1Y", "2Y", "5Y", "10Y", "30Y")
 
 ALL_ECONOMY_FIELDS = {
     "unemployment": ("Unemployment", "unemployment_rate", "pct"),
@@ -35,13 +37,20 @@ ALL_ECONOMY_FIELDS = {
     "cpi_yoy": ("CPI YoY", "cpi_year_over_year", "pct"),
 }
 
-DEFAULT_ECONOMY_KEYS = ["unemployment", "participation", "avg_hourly_wage", "cpi", "core_cpi"]
+DEFAULT_ECONOMY_KEYS = ("unemployment", "participation", "avg_hourly_wage", "cpi", "core_cpi")
+
+
+def _frozen_columns(columns: dict) -> MappingProxyType:
+    """Read-only view of a column table, with keys and header labels interned."""
+    return MappingProxyType({
+        sys.intern(key): (sys.intern(label), justify, min_width)
+        for key, (label, justify, min_width) in columns.items()
+    })
+
 
-# Column definitions per section
-# Each column: (header_label, justify, min_width)
 # Column definitions per section (symbol is always prepended automatically)
-# Each column: (header_label, justify, min_width)
-EQUITY_COLUMNS = {
+# Each column: (header_label, justify, min_width); the tables are read-only
+EQUITY_COLUMNS = _frozen_columns({
     "last":       ("Last", "right", 9),
     "chg":        ("Chg", "right", 9),
     "chg%":       ("Chg%", "right", 8),
@@ -52,9 +61,9 @@ EQUITY_COLUMNS = {
     "vol":        ("Vol", "right", 7),
     "mktcap":     ("Mkt Cap", "right", 9),
     "ytd%":       ("YTD%", "right", 8),
-}
+})
 
-INDEX_COLUMNS = {
+INDEX_COLUMNS = _frozen_columns({
     "last":       ("Last", "right", 12),
     "chg":        ("Chg", "right", 10),
     "chg%":       ("Chg%", "right", 8),
@@ -63,17 +72,22 @@ INDEX_COLUMNS = {
     "high":       ("High", "right", 10),
     "low":        ("Low", "right", 10),
     "ytd%":       ("YTD%", "right", 8),
-}
+})
 
-CRYPTO_COLUMNS = {
+CRYPTO_COLUMNS = _frozen_columns({
     "last":   ("Last", "right", 14),
     "chg":    ("Chg", "right", 12),
     "chg%":   ("Chg%", "right", 8),
-}
+})
+
+# Valid column keys per section, for validating config.ini column lists
+EQUITY_COLUMN_KEYS = frozenset(EQUITY_COLUMNS)
+INDEX_COLUMN_KEYS = frozenset(INDEX_COLUMNS)
+CRYPTO_COLUMN_KEYS = frozenset(CRYPTO_COLUMNS)
 
 # Symbol min-widths per section (symbol column is always first, no header)
 SYMBOL_MIN_WIDTH = {"equity": 6, "index": 8, "crypto": 10}
 
-DEFAULT_EQUITY_COLS = ["last", "chg", "chg%", "open_close", "high", "low", "vol"]
-DEFAULT_INDEX_COLS = ["last", "chg", "chg%"]
-DEFAULT_CRYPTO_COLS = ["last", "chg", "chg%"]
+DEFAULT_EQUITY_COLS = ("last", "chg", "chg%", "open_close", "high", "low", "vol")
+DEFAULT_INDEX_COLS = ("last", "chg", "chg%")
+DEFAULT_CRYPTO_COLS = ("last", "chg", "chg%")
@@ -1,8 +1,10 @@
 import json
 import threading
 import time
-from datetime import datetime, time as dt_time, timedelta
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from fintra.constants import ECON_CACHE_PATH
@@ -31,8 +33,9 @@ def _last_market_close() -> float:
 def _load_econ_cache(state: DashboardState) -> bool:
     """Load economy data from cache if it was fetched after the last market close."""
     try:
-        with open(ECON_CACHE_PATH, "r") as f:
-            cache = json.load(f)
+        # One binary read; json.loads decodes UTF-8 bytes itself, skipping the text layer
+        with open(ECON_CACHE_PATH, "rb") as f:
+            cache = json.loads(f.read())
         if cache.get("fetched_at", 0) > _last_market_close():
             state.treasury = cache.get("treasury", {})
             state.labor = cache.get("labor", {})
@@ -54,12 +57,49 @@ def _save_econ_cache(state: DashboardState):
             "labor": state.labor,
             "inflation": state.inflation,
         }
-        with open(ECON_CACHE_PATH, "w") as f:
-            json.dump(cache, f, default=lambda o: o.isoformat() if hasattr(o, "isoformat") else str(o))
+        # Serialize compactly up front and write once, rather than json.dump's many small writes
+        payload = json.dumps(cache, separators=(",", ":"),
+                             default=lambda o: o.isoformat() if hasattr(o, "isoformat") else str(o))
+        with open(ECON_CACHE_PATH, "wb") as f:
+            f.write(payload.encode())
     except Exception:
         pass
 
 
+def _by_ticker(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index row dicts by ticker; the dicts are shared with the list, not copied."""
+    return {d["ticker"]: d for d in items}
+
+
+def _is_current(state: DashboardState, watchlist: Dict[str, tuple]) -> bool:
+    """False once the app has switched away from `watchlist`; call under `state.lock`."""
+    return state.active_watchlist is None or state.active_watchlist is watchlist
+
+
+def _publish(state: DashboardState, section: str, rows: List[Dict[str, Any]],
+             watchlist: Dict[str, tuple]) -> bool:
+    """Swap in a section's new row list together with its ticker index, under the state lock.
+
+    Rows fetched for a watchlist that is no longer active are dropped; returns
+    whether they were published.
+    """
+    index = _by_ticker(rows)
+    with state.lock:
+        if not _is_current(state, watchlist):
+            return False
+        setattr(state, f"{section}_by_ticker", index)
+        setattr(state, section, rows)
+    return True
+
+
+def compute_change(last: Optional[float], prev_close: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+    """Return (change, change_pct) of `last` against `prev_close`, or (None, None) if either is missing."""
+    if last is None or not prev_close:
+        return None, None
+    change = last - prev_close
+    return change, (change / prev_close) * 100
+
+
 def _normalize_crypto_agg(agg: Dict[str, Any], prev_agg: Dict[str, Any],
                           ticker: str) -> Dict[str, Any]:
     """Convert crypto agg dict + previous close dict into a flat dict for rendering."""
@@ -70,47 +110,152 @@ def _normalize_crypto_agg(agg: Dict[str, Any], prev_agg: Dict[str, Any],
     d["low"] = agg.get("low")
     d["volume"] = agg.get("volume")
 
-    if prev_agg and d["last"] is not None:
-        prev_close = prev_agg.get("close")
-        if prev_close:
-            d["change"] = d["last"] - prev_close
-            d["change_pct"] = (d["change"] / prev_close) * 100
-        else:
-            d["change"] = None
-            d["change_pct"] = None
-    else:
-        d["change"] = None
-        d["change_pct"] = None
+    prev_close = prev_agg.get("close") if prev_agg else None
+    d["change"], d["change_pct"] = compute_change(d["last"], prev_close)
 
     return d
 
 
-def _fetch_via_aggs(provider, tickers: List[str], state: DashboardState) -> List[Dict[str, Any]]:
-    """Fallback: fetch stock/index data via get_aggs for Basic plan users."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    three_days_ago = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+@lru_cache(maxsize=1)
+def _agg_window(today: date) -> Tuple[str, str]:
+    """(three days ago, today) as YYYY-MM-DD for daily-agg requests; formatted once per day."""
+    return (today - timedelta(days=3)).strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
+
+
+# Grouped daily results for completed days, keyed by (market_type, day). A past
+# day's bars never change, so they are fetched once and dropped when the date rolls
+_grouped_cache: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+_grouped_cache_date: Optional[date] = None
+
+
+def _grouped_bars(provider, tickers: List[str], start: date, market_type: str, locale: str,
+                  max_days: int, start_final: bool, wait: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+    """Last two daily bars per watched ticker (oldest first) from grouped daily aggs.
+
+    Walks back from `start` (at most `max_days` days) until two days with bars for
+    the watchlist are found, so the request count doesn't grow with the number of
+    tickers. Days before `start` are complete and come from `_grouped_cache` after
+    the first fetch; `start` itself is cached only if `start_final` and it had bars
+    (a just-closed session may not be published yet). Only Basic plans use this, so
+    each request takes a `_basic_bucket` token; without `wait`, the walk stops
+    early when the market budget is spent and resumes on a later call.
+    """
+    global _grouped_cache_date
+    today = date.today()
+    if _grouped_cache_date != today:
+        _grouped_cache.clear()
+        _grouped_cache_date = today
+
+    bars: Dict[str, List[Dict[str, Any]]] = {}
+    days_found = 0
+    for days_back in range(max_days):
+        day = (start - timedelta(days=days_back)).strftime("%Y-%m-%d")
+        key = (market_type, day)
+        grouped = _grouped_cache.get(key)
+        if grouped is None:
+            if wait:
+                _basic_bucket.take()
+            elif not _basic_bucket.try_take(reserve=_MARKET_RESERVE):
+                break
+            try:
+                grouped = provider.fetch_grouped_daily(day, market_type=market_type, locale=locale)
+            except Exception:
+                continue
+            if days_back > 0 or (start_final and any(t in grouped for t in tickers)):
+                _grouped_cache[key] = grouped
+        hit = False
+        for t in tickers:
+            bar = grouped.get(t)
+            if bar is not None:
+                bars.setdefault(t, []).insert(0, bar)
+                hit = True
+        if hit:
+            days_found += 1
+            if days_found == 2:
+                break
+    return bars
+
+
+# When each Basic-plan ticker last had its own aggs requested (monotonic), so
+# polls short of budget refresh the longest-waiting tickers first
+_agg_fetched_at: Dict[str, float] = {}
+
+
+def _fetch_via_aggs(provider, tickers: List[str], state: DashboardState,
+                    old_index: Dict[str, Dict[str, Any]], grouped: bool = False) -> List[Dict[str, Any]]:
+    """Fallback: fetch stock/index data via daily aggs for Basic plan users.
+
+    With `grouped` (equities), the last two bars come from grouped daily aggs for
+    the last two closed sessions, cached per day, so a poll usually costs no
+    requests; walking back six days covers a weekend plus a holiday. Only tickers
+    they don't list (and all tickers otherwise, since indices have no grouped
+    endpoint) are fetched one by one via `_paced_fetches`.
+
+    Polls never wait on the Basic per-minute budget: they spend only the tokens
+    above `_MARKET_RESERVE` available right now, on the tickers fetched longest
+    ago, and tickers left over keep their row from `old_index` until a later poll
+    gets to them. Rows keep watchlist order.
+    """
+    three_days_ago, today = _agg_window(date.today())
+    if grouped:
+        # Start from the latest session that has closed, so the day still
+        # trading never costs a request
+        last_session = datetime.fromtimestamp(_last_market_close(), ZoneInfo("America/New_York")).date()
+        bars = _grouped_bars(provider, tickers, last_session, "stocks", "us", 6, True, wait=False)
+    else:
+        bars = {}
+    # Only tickers the grouped bars don't list at all need their own request
+    missing = sorted((t for t in tickers if t not in bars), key=lambda t: _agg_fetched_at.get(t, 0.0))
+    due = []
+    for t in missing:
+        if not _basic_bucket.try_take(reserve=_MARKET_RESERVE):
+            break
+        due.append(t)
+    now = time.monotonic()
+    for t in due:
+        _agg_fetched_at[t] = now
+    bars.update(_paced_fetches(lambda t: provider.fetch_aggs(t, 1, "day", three_days_ago, today), due, None))
     results = []
     for ticker in tickers:
-        try:
-            aggs = provider.fetch_aggs(ticker, 1, "day", three_days_ago, today)
-            if aggs and len(aggs) >= 2:
-                results.append(_normalize_crypto_agg(aggs[-1], aggs[-2], ticker))
-                if aggs[-2].get("close") is not None:
-                    state.prev_closes[ticker] = aggs[-2]["close"]
-            elif aggs:
-                results.append(_normalize_crypto_agg(aggs[-1], None, ticker))
-        except Exception:
-            pass
-        time.sleep(1)
+        aggs = bars.get(ticker)
+        if aggs and len(aggs) >= 2:
+            results.append(_normalize_crypto_agg(aggs[-1], aggs[-2], ticker))
+            if aggs[-2].get("close") is not None:
+                state.prev_closes[ticker] = aggs[-2]["close"]
+        elif ticker in old_index:
+            results.append(old_index[ticker])  # not reached this poll
+        elif aggs:
+            results.append(_normalize_crypto_agg(aggs[-1], None, ticker))
     return results
 
 
+def _select_rows(tickers: List[str], snap_map: Dict[str, Dict[str, Any]],
+                 old_index: Dict[str, Dict[str, Any]], now: float) -> List[Dict[str, Any]]:
+    """Pick `tickers` out of `snap_map` in watchlist order, flashing rows whose change moved."""
+    rows = []
+    for t in tickers:
+        d = snap_map.get(t)
+        if d is None:
+            continue
+        old = old_index.get(t)
+        old_chg = old.get("change") if old else None
+        new_chg = d.get("change")
+        if old_chg is not None and new_chg is not None and abs(new_chg - old_chg) > 0.001:
+            d["_flash_until"] = now + 1.0
+            d["_flash_up"] = (new_chg - old_chg) > 0
+        rows.append(d)
+    return rows
+
+
 _market_lock = threading.Lock()
 
 
-def fetch_market_data(provider, watchlist: Dict[str, List[str]],
+def fetch_market_data(provider, watchlist: Dict[str, tuple],
                       state: DashboardState, plans: PlanInfo):
     """Fetch data for stocks/indices. Uses snapshots if available, else aggs fallback."""
+    if not watchlist["equities"] and not watchlist["indices"]:
+        return
+
     if not _market_lock.acquire(blocking=False):
         return
     try:
@@ -129,81 +274,70 @@ def fetch_market_data(provider, watchlist: Dict[str, List[str]],
         else:
             agg_ix_tickers = watchlist["indices"]
 
-        # Snapshot old change values for flash-on-change detection
-        old_eq_changes = {item["ticker"]: item.get("change") for item in state.equities}
-        old_ix_changes = {item["ticker"]: item.get("change") for item in state.indices}
-
         # Fetch via snapshots where available
         if snap_tickers:
             snap_list = provider.fetch_snapshots(snap_tickers)
-            snap_map: Dict[str, Dict] = {d["ticker"]: d for d in snap_list}
+            # One pass: index by ticker and cache previous closes for WS change calculations
+            snap_map: Dict[str, Dict] = {}
+            prev_closes = state.prev_closes
+            for d in snap_list:
+                t = d["ticker"]
+                snap_map[t] = d
+                prev = d.get("prev_close")
+                if prev is not None:
+                    prev_closes[t] = prev
 
+            now = time.time()
+            state.flash_until = now + 1.0  # _select_rows may flash any row
             if plans.stocks_has_snapshots:
-                new_eq = []
-                for t in watchlist["equities"]:
-                    if t in snap_map:
-                        d = snap_map[t]
-                        old_chg = old_eq_changes.get(t)
-                        new_chg = d.get("change")
-                        if old_chg is not None and new_chg is not None and abs(new_chg - old_chg) > 0.001:
-                            d["_flash_until"] = time.time() + 1.0
-                            d["_flash_up"] = (new_chg - old_chg) > 0
-                        new_eq.append(d)
+                new_eq = _select_rows(watchlist["equities"], snap_map, state.equities_by_ticker, now)
                 if new_eq:
-                    state.equities = new_eq
+                    _publish(state, "equities", new_eq, watchlist)
             if plans.indices_has_snapshots:
-                new_ix = []
-                for t in watchlist["indices"]:
-                    if t in snap_map:
-                        d = snap_map[t]
-                        old_chg = old_ix_changes.get(t)
-                        new_chg = d.get("change")
-                        if old_chg is not None and new_chg is not None and abs(new_chg - old_chg) > 0.001:
-                            d["_flash_until"] = time.time() + 1.0
-                            d["_flash_up"] = (new_chg - old_chg) > 0
-                        new_ix.append(d)
+                new_ix = _select_rows(watchlist["indices"], snap_map, state.indices_by_ticker, now)
                 if new_ix:
-                    state.indices = new_ix
-
-            # Cache previous closes for WS change calculations
-            for t, d in snap_map.items():
-                prev = d.get("prev_close")
-                if prev is not None:
-                    state.prev_closes[t] = prev
+                    _publish(state, "indices", new_ix, watchlist)
 
         # Fetch via aggs fallback for Basic plan tickers
         if agg_eq_tickers:
-            new_eq = _fetch_via_aggs(provider, agg_eq_tickers, state)
+            new_eq = _fetch_via_aggs(provider, agg_eq_tickers, state, state.equities_by_ticker, grouped=True)
             if new_eq:
-                state.equities = new_eq
+                _publish(state, "equities", new_eq, watchlist)
         if agg_ix_tickers:
-            new_ix = _fetch_via_aggs(provider, agg_ix_tickers, state)
+            new_ix = _fetch_via_aggs(provider, agg_ix_tickers, state, state.indices_by_ticker)
             if new_ix:
-                state.indices = new_ix
+                _publish(state, "indices", new_ix, watchlist)
 
-        state.market_updated = time.time()
-        state.market_stale = False
-        state.market_error = ""
-        state.rate_limited = False
+        with state.lock:
+            if not _is_current(state, watchlist):
+                return  # switched away mid-fetch; the new watchlist's fetch reports status
+            state.market_updated = time.time()
+            state.market_stale = False
+            state.market_error = ""
+            state.rate_limited = False
 
     except Exception as e:
         err_str = str(e)
-        if "429" in err_str or "rate" in err_str.lower():
-            state.rate_limited = True
-            state.market_error = "Rate limited"
-        else:
-            state.market_error = str(e)[:80]
-        state.market_stale = True
+        with state.lock:
+            if not _is_current(state, watchlist):
+                return
+            if "429" in err_str or "rate" in err_str.lower():
+                state.rate_limited = True
+                state.market_error = "Rate limited"
+            else:
+                state.market_error = str(e)[:80]
+            state.market_stale = True
     finally:
         _market_lock.release()
+        state.bump()
 
 
 # Crypto fetch state — lock prevents overlapping fetches from racing
 _crypto_lock = threading.Lock()
-_last_crypto_fetch: float = 0.0
+_last_crypto_fetch: float = 0.0  # time.monotonic() of the last fetch; only used as an interval
 
 
-def fetch_crypto_data(provider, watchlist: Dict[str, List[str]],
+def fetch_crypto_data(provider, watchlist: Dict[str, tuple],
                       state: DashboardState, plans: PlanInfo):
     """Fetch crypto data. Uses snapshots if Starter plan, daily aggs if Basic."""
     global _last_crypto_fetch
@@ -228,7 +362,7 @@ def fetch_crypto_data(provider, watchlist: Dict[str, List[str]],
                     old_chg = old_crypto_changes.get(t)
                     new_chg = d.get("change")
                     if old_chg is not None and new_chg is not None and abs(new_chg - old_chg) > 0.001:
-                        d["_flash_until"] = time.time() + 1.0
+                        d["_flash_until"] = state.flash_until = time.time() + 1.0
                         d["_flash_up"] = (new_chg - old_chg) > 0
                     crypto_data.append(d)
                     prev = d.get("prev_close")
@@ -236,20 +370,28 @@ def fetch_crypto_data(provider, watchlist: Dict[str, List[str]],
                         state.prev_closes[t] = prev
             except Exception:
                 pass
-            _last_crypto_fetch = time.time()
+            _last_crypto_fetch = time.monotonic()
         else:
             # Basic plan: use get_aggs with rate limiting
             min_interval = max(len(crypto_tickers) * 12, 15)
-            now = time.time()
+            now = time.monotonic()
             if _last_crypto_fetch and (now - _last_crypto_fetch) < min_interval:
                 return  # too soon, skip this cycle
             _last_crypto_fetch = now
 
-            today = datetime.now().strftime("%Y-%m-%d")
-            three_days_ago = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+            now_dt = datetime.now()
+            three_days_ago, today = _agg_window(now_dt.date())
+            # Crypto trades around the clock, so today's bar is never final
+            grouped = _grouped_bars(provider, crypto_tickers, now_dt.date(), "crypto", "global", 4, False)
+            # Tickers not covered by the grouped bars fall back to their own aggs,
+            # paced at the Basic per-minute rate
+            missing = [t for t in crypto_tickers if len(grouped.get(t, ())) < 2]
+            grouped.update(_paced_fetches(
+                lambda t: provider.fetch_aggs(t, 1, "day", three_days_ago, today), missing, _basic_bucket))
+            data_ts = None
             for ticker in crypto_tickers:
                 try:
-                    aggs = provider.fetch_aggs(ticker, 1, "day", three_days_ago, today)
+                    aggs = grouped.get(ticker)
                     if aggs and len(aggs) >= 2:
                         cur = aggs[-1]
                         prev = aggs[-2]
@@ -259,91 +401,152 @@ def fetch_crypto_data(provider, watchlist: Dict[str, List[str]],
                     elif aggs:
                         cur = aggs[-1]
                         crypto_data.append(_normalize_crypto_agg(cur, None, ticker))
-                    # Store the data date from the most recent agg
+                    # Remember the most recent agg's timestamp for the data date
                     if aggs:
-                        ts = aggs[-1].get("timestamp")
-                        if ts:
-                            state.crypto_data_date = datetime.utcfromtimestamp(ts / 1000).strftime("%Y-%m-%d")
+                        data_ts = aggs[-1].get("timestamp") or data_ts
                 except Exception:
                     pass
-                time.sleep(1)
+            if data_ts:
+                state.crypto_data_date = datetime.utcfromtimestamp(data_ts / 1000).strftime("%Y-%m-%d")
 
         # Atomic swap — only overwrite if we got ALL tickers
         if len(crypto_data) == len(crypto_tickers):
-            state.crypto = crypto_data
+            if not _publish(state, "crypto", crypto_data, watchlist):
+                return
             state.crypto_updated = time.time()
             state.market_updated = state.market_updated or time.time()
         elif crypto_data:
             # Partial success — merge into existing data rather than replacing
-            existing = {d["ticker"]: d for d in state.crypto}
+            existing = dict(state.crypto_by_ticker)
             for d in crypto_data:
                 existing[d["ticker"]] = d
-            state.crypto = [existing[t] for t in crypto_tickers if t in existing]
+            merged = [existing[t] for t in crypto_tickers if t in existing]
+            if not _publish(state, "crypto", merged, watchlist):
+                return
             state.crypto_updated = time.time()
             state.market_updated = state.market_updated or time.time()
     finally:
         _crypto_lock.release()
+        state.bump()
 
 
-def fetch_ytd_closes(provider, watchlist: Dict[str, List[str]], state: DashboardState):
+def fetch_ytd_closes(provider, watchlist: Dict[str, tuple], state: DashboardState, plans: PlanInfo):
     """Fetch Dec 31 closing prices for YTD % calculation."""
     year = datetime.now().year
     # Try Dec 31 of previous year, then work backwards to find a trading day
     end_date = f"{year - 1}-12-31"
     start_date = f"{year - 1}-12-26"  # go back a few days in case Dec 31 was a weekend
 
-    for ticker in watchlist["equities"] + watchlist["indices"]:
-        if ticker in state.ytd_closes:
-            continue
-        try:
-            aggs = provider.fetch_aggs(ticker, 1, "day", start_date, end_date)
+    def _fetch(t):
+        return provider.fetch_aggs(t, 1, "day", start_date, end_date)
+
+    # Equities and indices are paced by their own plan's rate limit
+    for tickers, tier in ((watchlist["equities"], plans.stocks), (watchlist["indices"], plans.indices)):
+        pending = [t for t in tickers if t not in state.ytd_closes]
+        for ticker, aggs in _paced_fetches(_fetch, pending, _rest_bucket(tier)):
             if aggs:
                 state.ytd_closes[ticker] = aggs[-1]["close"]
-        except Exception:
-            pass
-        time.sleep(0.5)  # gentle rate limiting
+                state.bump()
 
 
-def fetch_ticker_details(provider, watchlist: Dict[str, List[str]], state: DashboardState):
+def fetch_ticker_details(provider, watchlist: Dict[str, tuple], state: DashboardState, plans: PlanInfo):
     """Fetch static ticker details (market cap) once at startup."""
-    for ticker in watchlist["equities"]:
-        if ticker in state.ticker_details:
-            continue
+    pending = [t for t in watchlist["equities"] if t not in state.ticker_details]
+    for ticker, d in _paced_fetches(provider.fetch_ticker_details, pending, _rest_bucket(plans.stocks)):
+        state.ticker_details[ticker] = d
+        state.bump()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: up to `rate` calls per `per` seconds, refilled continuously."""
+
+    def __init__(self, rate: float, per: float):
+        self._capacity = rate
+        self._tokens = rate
+        self._fill_rate = rate / per
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+        self._updated = now
+
+    def take(self, n: float = 1):
+        """Block until `n` tokens are available, then consume them."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return
+                wait = (n - self._tokens) / self._fill_rate
+            time.sleep(wait)
+
+    def try_take(self, n: float = 1, reserve: float = 0) -> bool:
+        """Consume `n` tokens if at least `reserve` would be left; never blocks."""
+        with self._lock:
+            self._refill()
+            if self._tokens - n >= reserve:
+                self._tokens -= n
+                return True
+            return False
+
+
+# Economy endpoints share a 5 calls/min budget
+_econ_bucket = TokenBucket(5, 60.0)
+
+# Per-ticker REST calls (aggs fallback, YTD closes, ticker details) on a Basic plan
+# count against the same 5 calls/min quota as the economy endpoints
+_basic_bucket = _econ_bucket
+
+# Basic market polls only spend tokens above this many, so the economy, crypto
+# and YTD/market-cap fetches (which wait for tokens) are never starved by polling
+_MARKET_RESERVE = 2
+
+# Paid plans aren't capped per minute; 5 calls/sec keeps bursts polite
+_agg_bucket = TokenBucket(5, 1.0)
+
+# Worker pool reused across fetches instead of a thread per request
+_fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fintra-fetch")
+
+
+def _rest_bucket(tier: str) -> TokenBucket:
+    """Rate limiter for per-ticker REST calls under the given plan tier."""
+    return _basic_bucket if tier == "basic" else _agg_bucket
+
+
+def _paced_fetches(fn: Callable[[str], Any], tickers: List[str],
+                   bucket: Optional[TokenBucket]) -> Iterator[Tuple[str, Any]]:
+    """Run `fn(ticker)` for each ticker concurrently on `_fetch_pool`, paced by `bucket`.
+
+    Tokens are taken here, before each submit, so pool workers never sit waiting
+    on a slow (per-minute) bucket; pass None when the caller already holds them.
+    Yields (ticker, result) in input order; tickers whose call raised are skipped.
+    """
+    futures = []
+    for t in tickers:
+        if bucket is not None:
+            bucket.take()
+        futures.append((t, _fetch_pool.submit(fn, t)))
+    for ticker, future in futures:
         try:
-            d = provider.fetch_ticker_details(ticker)
-            state.ticker_details[ticker] = d
+            yield ticker, future.result()
         except Exception:
-            pass
-        time.sleep(0.5)
-
-
-def _fetch_with_timeout(fn, timeout=10):
-    """Run a data fetch in a thread with a timeout to avoid hanging on 429 retries."""
-    result = [None]
-    error = [None]
-
-    def _run():
-        try:
-            result[0] = fn()
-        except Exception as e:
-            error[0] = e
+            continue
 
-    t = threading.Thread(target=_run, daemon=True)
-    t.start()
-    t.join(timeout)
-    if t.is_alive():
-        raise TimeoutError("Request timed out")
-    if error[0]:
-        raise error[0]
-    return result[0]
 
+def _fetch_economy_endpoint(fn, retries=2):
+    """Try fetching an economy endpoint with retries on timeout/429.
 
-def _fetch_economy_endpoint(fn, timeout=20, retries=2):
-    """Try fetching an economy endpoint with retries on timeout/429."""
+    Each attempt takes a token from the shared economy rate limiter first. The
+    call runs inline; the provider's socket timeouts bound how long it can block.
+    """
     for attempt in range(retries + 1):
+        _econ_bucket.take()
         try:
-            return _fetch_with_timeout(fn, timeout=timeout)
-        except (TimeoutError, Exception) as e:
+            return fn()
+        except Exception as e:
             err_str = str(e)
             if attempt < retries and ("429" in err_str or "timed out" in err_str.lower()):
                 time.sleep(15)  # wait and retry
@@ -351,71 +554,81 @@ def _fetch_economy_endpoint(fn, timeout=20, retries=2):
             raise
 
 
-def fetch_economy_data(provider, state: DashboardState):
-    """Fetch treasury yields, labor market, and inflation data.
+def _fetch_treasury(provider, state: DashboardState):
+    y = _fetch_economy_endpoint(provider.fetch_treasury_yields)
+    if y:
+        state.treasury = y
+        state.bump()  # show each section as soon as it lands
 
-    Checks disk cache first — skips API calls if data was fetched after the
-    last NYSE close (4 PM ET).  Spaces API calls 15s apart to stay within
-    5 calls/min rate limits.
-    """
-    if _load_econ_cache(state):
-        return
 
-    had_error = False
+def _fetch_labor(provider, state: DashboardState):
+    lm = _fetch_economy_endpoint(provider.fetch_labor_market)
+    if lm:
+        state.labor = lm
+        state.bump()
 
-    # Treasury yields
-    try:
-        y = _fetch_economy_endpoint(lambda: provider.fetch_treasury_yields())
-        if y:
-            state.treasury = y
-    except Exception as e:
-        err_str = str(e)
-        if "429" not in err_str and "timed out" not in err_str.lower():
-            state.economy_error = f"Treasury: {err_str[:60]}"
-        had_error = True
 
-    time.sleep(15)  # space calls to avoid 429
+def _fetch_inflation(provider, state: DashboardState):
+    # 13 months for the YoY calculation
+    records = _fetch_economy_endpoint(lambda: provider.fetch_inflation(limit=13))
+    if records:
+        cur = records[0]
+        inflation = {
+            "cpi": cur.get("cpi"),
+            "cpi_core": cur.get("cpi_core"),
+            "date": cur.get("date"),
+            "cpi_year_over_year": None,
+        }
+        # Calculate CPI YoY from current vs 12-month-ago record
+        if len(records) >= 13:
+            cur_cpi = cur.get("cpi")
+            yago_cpi = records[-1].get("cpi")
+            if cur_cpi and yago_cpi:
+                inflation["cpi_year_over_year"] = ((cur_cpi - yago_cpi) / yago_cpi) * 100
+        state.inflation = inflation
+        state.bump()
 
-    # Labor market
-    try:
-        lm = _fetch_economy_endpoint(lambda: provider.fetch_labor_market())
-        if lm:
-            state.labor = lm
-    except Exception as e:
-        err_str = str(e)
-        if "429" not in err_str and "timed out" not in err_str.lower():
-            state.economy_error = f"Labor: {err_str[:60]}"
-        had_error = True
 
-    time.sleep(15)  # space calls to avoid 429
+_ECON_ENDPOINTS = (("Treasury", _fetch_treasury), ("Labor", _fetch_labor), ("Inflation", _fetch_inflation))
+
+# Runs the economy endpoints side by side; kept apart from _fetch_pool so rate
+# limit waits and 429 retry sleeps never hold up per-ticker fetches
+_econ_pool = ThreadPoolExecutor(max_workers=len(_ECON_ENDPOINTS), thread_name_prefix="fintra-econ")
+
+
+def fetch_economy_data(provider, state: DashboardState):
+    """Fetch treasury yields, labor market, and inflation data.
 
-    # Inflation — fetch 13 months for YoY calculation
+    Checks disk cache first — skips API calls if data was fetched after the
+    last NYSE close (4 PM ET).  The three endpoints are requested concurrently;
+    calls are still paced by `_econ_bucket` to stay within 5 calls/min rate
+    limits instead of fixed sleeps.
+    """
     try:
-        records = _fetch_economy_endpoint(lambda: provider.fetch_inflation(limit=13))
-        if records:
-            cur = records[0]
-            state.inflation = {
-                "cpi": cur.get("cpi"),
-                "cpi_core": cur.get("cpi_core"),
-                "date": cur.get("date"),
-                "cpi_year_over_year": None,
-            }
-            # Calculate CPI YoY from current vs 12-month-ago record
-            if len(records) >= 13:
-                cur_cpi = cur.get("cpi")
-                yago_cpi = records[-1].get("cpi")
-                if cur_cpi and yago_cpi:
-                    state.inflation["cpi_year_over_year"] = ((cur_cpi - yago_cpi) / yago_cpi) * 100
-    except Exception as e:
-        err_str = str(e)
-        if "429" not in err_str and "timed out" not in err_str.lower():
-            state.economy_error = f"Inflation: {err_str[:60]}"
-        had_error = True
+        if _load_econ_cache(state):
+            state.bump()
+            return
 
-    if had_error:
-        state.economy_stale = True
-    else:
-        state.economy_stale = False
-        state.economy_updated = time.time()
-        state.economy_error = ""
-        _save_econ_cache(state)
+        had_error = False
+        futures = [(label, _econ_pool.submit(fn, provider, state)) for label, fn in _ECON_ENDPOINTS]
+        for label, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                err_str = str(e)
+                if "429" not in err_str and "timed out" not in err_str.lower():
+                    state.economy_error = f"{label}: {err_str[:60]}"
+                had_error = True
+
+        if had_error:
+            state.economy_stale = True
+        else:
+            state.economy_stale = False
+            state.economy_updated = time.time()
+            state.economy_error = ""
+            _save_econ_cache(state)
+        state.bump()
+    finally:
+        # Signal completion whether or not every endpoint succeeded, so work
+        # deferred behind the economy fetch never waits forever
+        state.economy_done.set()
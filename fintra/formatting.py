@@ -1,37 +1,66 @@
+from functools import lru_cache, wraps
 from typing import Optional
 
 from rich.text import Text
 
+# Cached formatters return shared Text objects — callers must .copy() before mutating.
 
+# Placeholder for missing values, shared by every formatter and panel
+DASH = Text("—", style="dim")
+
+
+def _signed_cache(maxsize: int):
+    """lru_cache for formatters whose output depends on the value's sign.
+
+    -0.0 hashes equal to 0.0, so without normalising (`val + 0.0`) whichever was
+    formatted first would be served for both.
+    """
+    def decorate(fn):
+        cached = lru_cache(maxsize=maxsize)(fn)
+
+        @wraps(fn)
+        def wrapper(val, *args, **kwargs):
+            return cached(None if val is None else val + 0.0, *args, **kwargs)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorate
+
+
+@lru_cache(maxsize=2048)  # several price columns per row
 def fmt_price(val: Optional[float], large: bool = False, style: str = "cyan") -> Text:
     if val is None:
-        return Text("—", style="dim")
+        return DASH
     if large:
         return Text(f"{val:,.2f}", style=style)
     return Text(f"{val:.2f}", style=style)
 
 
+@_signed_cache(maxsize=512)
 def fmt_change(val: Optional[float], large: bool = False) -> Text:
     if val is None:
-        return Text("—", style="dim")
+        return DASH
     sign = "+" if val >= 0 else ""
     s = f"{sign}{val:,.2f}" if large else f"{sign}{val:.2f}"
     style = "green" if val >= 0 else "red"
     return Text(s, style=style)
 
 
+@_signed_cache(maxsize=512)
 def fmt_pct(val: Optional[float]) -> Text:
     if val is None:
-        return Text("—", style="dim")
+        return DASH
     sign = "+" if val >= 0 else ""
     s = f"{sign}{val:.2f}%"
     style = "green" if val >= 0 else "red"
     return Text(s, style=style)
 
 
+@lru_cache(maxsize=512)
 def fmt_volume(val: Optional[float]) -> Text:
     if val is None:
-        return Text("—", style="dim")
+        return DASH
     if val >= 1_000_000_000:
         s = f"{val / 1_000_000_000:.1f}B"
     elif val >= 1_000_000:
@@ -43,9 +72,10 @@ def fmt_volume(val: Optional[float]) -> Text:
     return Text(s, style="cyan")
 
 
+@lru_cache(maxsize=512)
 def fmt_market_cap(val: Optional[float]) -> Text:
     if val is None:
-        return Text("—", style="dim")
+        return DASH
     if val >= 1_000_000_000_000:
         s = f"${val / 1_000_000_000_000:.2f}T"
     elif val >= 1_000_000_000:
@@ -57,12 +87,14 @@ def fmt_market_cap(val: Optional[float]) -> Text:
     return Text(s, style="cyan")
 
 
+@lru_cache(maxsize=512)
 def fmt_yield_val(val: Optional[float]) -> Text:
     if val is None:
-        return Text("—", style="dim")
+        return DASH
     return Text(f"{val:.2f}%", style="cyan")
 
 
+@_signed_cache(maxsize=512)
 def fmt_ext_chg(val: Optional[float], large: bool = False) -> Optional[Text]:
     """Format extended hours change as dim parenthesized text, e.g. ' (+1.50)'."""
     if val is None:
@@ -73,6 +105,7 @@ def fmt_ext_chg(val: Optional[float], large: bool = False) -> Optional[Text]:
     return Text(f" ({s})", style=f"dim {color}")
 
 
+@_signed_cache(maxsize=512)
 def fmt_ext_pct(val: Optional[float]) -> Optional[Text]:
     """Format extended hours change percent as dim parenthesized text, e.g. ' (+0.85%)'."""
     if val is None:
@@ -80,6 +113,3 @@ def fmt_ext_pct(val: Optional[float]) -> Optional[Text]:
     sign = "+" if val >= 0 else ""
     color = "green" if val >= 0 else "red"
     return Text(f" ({sign}{val:.2f}%)", style=f"dim {color}")
-
-
-
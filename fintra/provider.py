@@ -1,6 +1,8 @@
 """Massive API provider — the only module that imports from massive."""
 
-from typing import Any, Callable, Dict, List
+import sys
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Tuple
 
 from massive import RESTClient
 from massive import WebSocketClient
@@ -10,38 +12,119 @@ from massive.websocket.models import CurrencyAgg, EquityAgg, IndexValue
 from fintra.constants import ALL_YIELD_FIELDS
 
 
+# WS message handlers append (ticker, price, extras) to `out`. Tickers are interned
+# so dict lookups against the (interned) watchlist keys short-circuit on identity.
+def _on_equity_agg(msg: EquityAgg, out: list):
+    if msg.symbol and msg.close is not None:
+        out.append((sys.intern(msg.symbol), msg.close,
+                    {"high": msg.high, "low": msg.low, "volume": msg.accumulated_volume}))
+
+
+def _on_index_value(msg: IndexValue, out: list):
+    if msg.ticker and msg.value is not None:
+        out.append((sys.intern(msg.ticker), msg.value, {}))
+
+
+def _on_currency_agg(msg: CurrencyAgg, out: list):
+    if msg.pair and msg.close is not None:
+        out.append((sys.intern(msg.pair), msg.close,
+                    {"high": msg.high, "low": msg.low, "volume": msg.volume}))
+
+
+# Exact-type dispatch for parsed WS messages (SDK models are never subclassed)
+_MSG_HANDLERS = {
+    EquityAgg: _on_equity_agg,
+    IndexValue: _on_index_value,
+    CurrencyAgg: _on_currency_agg,
+}
+
+
 class WsFeed:
-    """Thin wrapper around WebSocketClient for lifecycle management."""
+    """Thin wrapper around WebSocketClient for lifecycle management.
+
+    `run()` and `close()` are coroutines: every feed runs on the one shared WS
+    event loop (see fintra.websocket).
+    """
 
-    def __init__(self, ws_client: WebSocketClient, on_update: Callable, market: str):
+    def __init__(self, ws_client: WebSocketClient, on_updates: Callable, market: str,
+                 subscriptions: List[str]):
         self._ws = ws_client
-        self._on_update = on_update
+        self._on_updates = on_updates
         self._market = market
+        self.subscriptions = subscriptions
+
+    async def run(self):
+        """Run the WS session until it closes, dispatching parsed updates."""
+        await self._ws.connect(self._process)
 
-    def run(self):
-        """Blocking — runs the WS event loop, dispatching parsed updates."""
-        self._ws.run(lambda msgs: self._handle(msgs))
+    async def close(self):
+        # The SDK logs a warning to stdout if nothing is open, which would tear the screen
+        if self._ws.websocket is not None:
+            await self._ws.close()
+
+    def resubscribe(self, subscriptions: List[str]):
+        """Move the session to `subscriptions` without reconnecting.
+
+        Must run on the WS event loop; the SDK subscribes/unsubscribes only the
+        difference on its next receive cycle (or on connect, if not yet open).
+        """
+        old, new = set(self.subscriptions), set(subscriptions)
+        if old - new:
+            self._ws.unsubscribe(*(old - new))
+        if new - old:
+            self._ws.subscribe(*(new - old))
+        self.subscriptions = subscriptions
 
-    def close(self):
-        self._ws.close()
+    async def _process(self, msgs):
+        self._handle(msgs)
 
     def _handle(self, msgs):
+        """Parse one frame of messages and hand them to the callback as a single batch."""
+        updates: List[Tuple[str, float, Dict]] = []
         for msg in msgs:
-            if isinstance(msg, EquityAgg) and msg.symbol and msg.close is not None:
-                self._on_update(msg.symbol, msg.close,
-                                {"high": msg.high, "low": msg.low,
-                                 "volume": msg.accumulated_volume})
-            elif isinstance(msg, IndexValue) and msg.ticker and msg.value is not None:
-                self._on_update(msg.ticker, msg.value, {})
-            elif isinstance(msg, CurrencyAgg) and msg.pair and msg.close is not None:
-                self._on_update(msg.pair, msg.close,
-                                {"high": msg.high, "low": msg.low,
-                                 "volume": msg.volume})
+            handler = _MSG_HANDLERS.get(type(msg))
+            if handler is not None:
+                handler(msg, updates)
+        if updates:
+            self._on_updates(updates)
+
+
+# Bulk attribute readers for _normalize_snapshot (one C-level call instead of ~15 getattr calls)
+_SESSION_FIELDS = (
+    "close", "price", "open", "high", "low", "volume", "change", "change_percent", "previous_close",
+    "early_trading_change", "early_trading_change_percent",
+    "late_trading_change", "late_trading_change_percent",
+    "regular_trading_change", "regular_trading_change_percent",
+)
+_SESSION_GET = attrgetter(*_SESSION_FIELDS)
+_SNAP_FIELDS = ("value", "price", "open", "high", "low", "volume", "change", "change_percent")
+_SNAP_GET = attrgetter(*_SNAP_FIELDS)
+_BAR_FIELDS = ("open", "high", "low", "close", "volume", "timestamp")
+_BAR_GET = attrgetter(*_BAR_FIELDS)
+_YIELD_FIELDS = tuple(ALL_YIELD_FIELDS.values()) + ("date",)
+_YIELD_GET = attrgetter(*_YIELD_FIELDS)
+
+
+def _get_fields(obj: Any, getter: attrgetter, names: Tuple[str, ...]) -> tuple:
+    """Read several attributes at once; falls back to getattr defaults if any is missing."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        return tuple(getattr(obj, n, None) for n in names)
 
 
 _MARKET_MAP = {"stocks": Market.Stocks, "indices": Market.Indices, "crypto": Market.Crypto}
 _FEED_MAP = {"realtime": Feed.RealTime, "delayed": Feed.Delayed}
-_SUB_PREFIX = {"stocks": "A", "indices": "V", "crypto": "XA"}
+_SUB_PREFIX = {"stocks": "A.", "indices": "V.", "crypto": "XA."}
+
+# Keep-alive connections per host; matches the number of fetches that can run at once
+_HTTP_POOL_MAXSIZE = 8
+# Socket-level timeouts, so a stalled connection fails in the worker instead of
+# only being abandoned by the caller's future timeout
+_HTTP_CONNECT_TIMEOUT = 5.0
+_HTTP_READ_TIMEOUT = 10.0
+# urllib3 retry backoff factor for 429/5xx responses
+_HTTP_RETRY_BACKOFF = 2.0
 
 
 class MassiveProvider:
@@ -49,7 +132,17 @@ class MassiveProvider:
 
     def __init__(self, api_key: str):
         self._api_key = api_key
-        self._client = RESTClient(api_key=api_key)
+        self._client = RESTClient(api_key=api_key, connect_timeout=_HTTP_CONNECT_TIMEOUT,
+                                  read_timeout=_HTTP_READ_TIMEOUT)
+        # urllib3 defaults to one pooled connection per host, so concurrent fetches
+        # would open (and then discard) a fresh TLS connection each time
+        self._client.client.connection_pool_kw["maxsize"] = _HTTP_POOL_MAXSIZE
+        # urllib3 would otherwise sleep out a 429's Retry-After (which can run to
+        # minutes) inside the worker; callers handle 429s with their own backoff.
+        # Its own retries are spread out (0s, 4s, 8s) rather than fired back to back
+        retries = self._client.client.connection_pool_kw["retries"]
+        self._client.client.connection_pool_kw["retries"] = retries.new(
+            respect_retry_after_header=False, backoff_factor=_HTTP_RETRY_BACKOFF)
 
     # -- Snapshots / Aggs ------------------------------------------------
 
@@ -61,7 +154,7 @@ class MassiveProvider:
             t = getattr(snap, "ticker", None)
             if not t or getattr(snap, "error", None):
                 continue
-            results.append(self._normalize_snapshot(snap, t))
+            results.append(self._normalize_snapshot(snap, sys.intern(t)))
         return results
 
     def fetch_aggs(self, ticker: str, multiplier: int, timespan: str,
@@ -70,17 +163,19 @@ class MassiveProvider:
         raw = self._client.get_aggs(ticker, multiplier, timespan, from_date, to_date)
         if not raw:
             return []
-        return [
-            {
-                "open": getattr(a, "open", None),
-                "high": getattr(a, "high", None),
-                "low": getattr(a, "low", None),
-                "close": getattr(a, "close", None),
-                "volume": getattr(a, "volume", None),
-                "timestamp": getattr(a, "timestamp", None),
-            }
-            for a in raw
-        ]
+        return [self._normalize_bar(a) for a in raw]
+
+    def fetch_grouped_daily(self, date: str, market_type: str = "stocks",
+                            locale: str = "us") -> Dict[str, Dict[str, Any]]:
+        """Fetch one day's bar for every ticker in a market, keyed by ticker.
+
+        One request regardless of watchlist size; crypto uses market_type="crypto",
+        locale="global". Returns {} when the day has no bars yet.
+        """
+        raw = self._client.get_grouped_daily_aggs(date, locale=locale, market_type=market_type)
+        if not raw:
+            return {}
+        return {sys.intern(a.ticker): self._normalize_bar(a) for a in raw if getattr(a, "ticker", None)}
 
     # -- Market status ---------------------------------------------------
 
@@ -108,11 +203,7 @@ class MassiveProvider:
     def fetch_treasury_yields(self) -> Dict[str, Any]:
         """Single call for the latest treasury yields row."""
         y = next(iter(self._client.list_treasury_yields(sort="date.desc", limit=1)))
-        result: Dict[str, Any] = {}
-        for attr in ALL_YIELD_FIELDS.values():
-            result[attr] = getattr(y, attr, None)
-        result["date"] = getattr(y, "date", None)
-        return result
+        return dict(zip(_YIELD_FIELDS, _get_fields(y, _YIELD_GET, _YIELD_FIELDS)))
 
     def fetch_labor_market(self) -> Dict[str, Any]:
         """Single call for the latest labor-market indicators row."""
@@ -158,27 +249,36 @@ class MassiveProvider:
 
     # -- WebSocket feeds -------------------------------------------------
 
+    @staticmethod
+    def ws_subscriptions(market: str, tickers: List[str]) -> List[str]:
+        """Channel names for `tickers` on `market`, e.g. ["A.AAPL", "A.MSFT"]."""
+        return list(map(_SUB_PREFIX[market].__add__, tickers))
+
     def create_ws_feed(self, market: str, feed_type: str,
-                       tickers: List[str],
-                       on_update: Callable[[str, float, Dict], None]) -> WsFeed:
+                       subscriptions: List[str],
+                       on_updates: Callable[[List[Tuple[str, float, Dict]]], None]) -> WsFeed:
         """Create a WsFeed wrapping the SDK WebSocketClient.
 
-        market:    "stocks" / "indices" / "crypto"
-        feed_type: "realtime" / "delayed"
-        on_update: callback(ticker, price, extras_dict)
+        market:        "stocks" / "indices" / "crypto"
+        feed_type:     "realtime" / "delayed"
+        subscriptions: channel list from ws_subscriptions(), reused across reconnects
+        on_updates:    callback([(ticker, price, extras_dict), ...]) — one call per WS frame
         """
-        prefix = _SUB_PREFIX[market]
-        subs = [f"{prefix}.{t}" for t in tickers]
         ws = WebSocketClient(
             api_key=self._api_key,
             feed=_FEED_MAP[feed_type],
             market=_MARKET_MAP[market],
-            subscriptions=subs,
+            subscriptions=subscriptions,
         )
-        return WsFeed(ws, on_update, market)
+        return WsFeed(ws, on_updates, market, subscriptions)
 
     # -- Internal helpers ------------------------------------------------
 
+    @staticmethod
+    def _normalize_bar(a: Any) -> Dict[str, Any]:
+        """Convert an API agg bar to a flat dict."""
+        return dict(zip(_BAR_FIELDS, _get_fields(a, _BAR_GET, _BAR_FIELDS)))
+
     @staticmethod
     def _normalize_snapshot(snap: Any, ticker: str) -> Dict[str, Any]:
         """Convert an API snapshot object to a flat dict."""
@@ -186,31 +286,18 @@ class MassiveProvider:
 
         session = getattr(snap, "session", None)
         if session:
-            d["last"] = getattr(session, "close", None) or getattr(session, "price", None)
-            d["open"] = getattr(session, "open", None)
-            d["high"] = getattr(session, "high", None)
-            d["low"] = getattr(session, "low", None)
-            d["volume"] = getattr(session, "volume", None)
-            d["change"] = getattr(session, "change", None)
-            d["change_pct"] = getattr(session, "change_percent", None)
-            d["prev_close"] = getattr(session, "previous_close", None)
-            d["pre_market_change"] = getattr(session, "early_trading_change", None)
-            d["pre_market_change_pct"] = getattr(session, "early_trading_change_percent", None)
-            d["after_hours_change"] = getattr(session, "late_trading_change", None)
-            d["after_hours_change_pct"] = getattr(session, "late_trading_change_percent", None)
-            d["regular_change"] = getattr(session, "regular_trading_change", None)
-            d["regular_change_pct"] = getattr(session, "regular_trading_change_percent", None)
+            (close, price, d["open"], d["high"], d["low"], d["volume"], d["change"], d["change_pct"],
+             d["prev_close"], d["pre_market_change"], d["pre_market_change_pct"],
+             d["after_hours_change"], d["after_hours_change_pct"],
+             d["regular_change"], d["regular_change_pct"]) = _get_fields(session, _SESSION_GET, _SESSION_FIELDS)
+            d["last"] = close or price
             # Derive prev_close from close - change if not directly available
             if d["prev_close"] is None and d["last"] is not None and d["change"] is not None:
                 d["prev_close"] = d["last"] - d["change"]
         else:
-            d["last"] = getattr(snap, "value", None) or getattr(snap, "price", None)
-            d["open"] = getattr(snap, "open", None)
-            d["high"] = getattr(snap, "high", None)
-            d["low"] = getattr(snap, "low", None)
-            d["volume"] = getattr(snap, "volume", None)
-            d["change"] = getattr(snap, "change", None)
-            d["change_pct"] = getattr(snap, "change_percent", None)
+            (value, price, d["open"], d["high"], d["low"], d["volume"],
+             d["change"], d["change_pct"]) = _get_fields(snap, _SNAP_GET, _SNAP_FIELDS)
+            d["last"] = value or price
             d["prev_close"] = None
 
         # Fallback: last_trade
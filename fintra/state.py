@@ -1,12 +1,34 @@
+import copy
+import sys
+import threading
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+# __slots__ via dataclass is 3.10+; older interpreters fall back to a plain dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Per-watchlist fields cleared on a watchlist switch; market status, rate-limit,
+# loop-control and display-versioning fields carry over
+_WATCHLIST_FIELDS = (
+    "equities", "crypto", "indices",
+    "equities_by_ticker", "crypto_by_ticker", "indices_by_ticker",
+    "treasury", "labor", "inflation",
+    "market_updated", "crypto_updated", "crypto_data_date", "economy_updated",
+    "market_stale", "economy_stale", "market_error", "economy_error",
+    "prev_closes", "ytd_closes", "ticker_details",
+    "ws_connected", "watchlist_error",
+)
+
+
+@dataclass(**_SLOTS)
 class DashboardState:
     equities: List[Dict[str, Any]] = field(default_factory=list)
     crypto: List[Dict[str, Any]] = field(default_factory=list)
     indices: List[Dict[str, Any]] = field(default_factory=list)
+    # ticker → row dict, same objects as the lists above (O(1) lookup for WS updates)
+    equities_by_ticker: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    crypto_by_ticker: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    indices_by_ticker: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     treasury: Dict[str, Optional[float]] = field(default_factory=dict)
     labor: Dict[str, Optional[float]] = field(default_factory=dict)
     inflation: Dict[str, Optional[float]] = field(default_factory=dict)
@@ -29,9 +51,57 @@ class DashboardState:
     market_is_open: bool = False   # US equities (NYSE/NASDAQ)
     indices_group_status: Dict[str, str] = field(default_factory=dict)  # group → "open"/"closed"
     rate_limited: bool = False
+    rate_limit_backoff: float = 1.0  # market poll interval multiplier; grows on 429s, decays on success
     ws_connected: bool = False
     quit_flag: bool = False
 
+    # Display versioning: bump() after any change that affects the screen. The main loop
+    # redraws only when `version` moves (or a row flash set to expire at `flash_until` ends).
+    version: int = 0
+    flash_until: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    dirty: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+
+    # Set when each economy fetch attempt finishes (from cache, fetched, or failed);
+    # YTD/market-cap fetches wait on it so they don't contend with the economy rate limit
+    economy_done: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+
     switch_watchlist: bool = False
     watchlist_error: str = ""
     active_watchlist_name: str = ""
+    # The parsed watchlist being shown; fetches started for an earlier one drop
+    # their results. None until the app sets it (any watchlist is accepted)
+    active_watchlist: Optional[Dict[str, tuple]] = field(default=None, repr=False, compare=False)
+
+    def bump(self) -> None:
+        """Record a display-affecting change and wake the main loop."""
+        with self.lock:
+            self.version += 1
+        self.dirty.set()
+
+    def reset_watchlist(self, name: str, watchlist: Dict[str, tuple]) -> None:
+        """Reset per-watchlist data to a fresh state's defaults in one locked step.
+
+        The object itself is kept: the key listener, workers and WS feeds all
+        hold a reference to it.
+        """
+        fresh = DashboardState()
+        with self.lock:
+            for attr in _WATCHLIST_FIELDS:
+                setattr(self, attr, getattr(fresh, attr))
+            self.active_watchlist_name = name
+            self.active_watchlist = watchlist
+        self.economy_done.clear()
+
+    def snapshot(self) -> "DashboardState":
+        """Shallow copy taken under the lock, for rendering.
+
+        Only the top-level fields are consistent: section lists and their
+        `*_by_ticker` indexes are swapped together under the lock, so the copy
+        holds a matching pair. The containers are shared, not copied. WS batches
+        update row dicts in place and `prev_closes`, `ytd_closes` and
+        `ticker_details` are filled key by key, so a frame built while those
+        run can mix values from before and after them.
+        """
+        with self.lock:
+            return copy.copy(self)
@@ -1,7 +1,9 @@
+import os
 import sys
 import time
 from datetime import datetime
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from rich.layout import Layout
 from rich.panel import Panel
@@ -15,13 +17,19 @@ from fintra.constants import (
     ALL_ECONOMY_FIELDS, DEFAULT_ECONOMY_KEYS,
 )
 from fintra.formatting import (
-    fmt_price, fmt_change, fmt_pct, fmt_volume, fmt_market_cap, fmt_yield_val,
+    DASH, fmt_price, fmt_change, fmt_pct, fmt_volume, fmt_market_cap, fmt_yield_val,
     fmt_ext_chg, fmt_ext_pct,
 )
 from fintra.plans import PlanInfo
 from fintra.state import DashboardState
 
 
+@lru_cache(maxsize=256)
+def _display_symbol(ticker: str) -> str:
+    """Strip the I:/X: market prefix from a raw ticker for the symbol column."""
+    return ticker.split(":", 1)[-1]
+
+
 def _get_ext_hours(item: Dict[str, Any]) -> tuple:
     """Return (ext_change, ext_change_pct, label) for extended hours, or Nones."""
     ah_chg = item.get("after_hours_change")
@@ -35,9 +43,9 @@ def _get_ext_hours(item: Dict[str, Any]) -> tuple:
     return (None, None, None)
 
 
-def _apply_flash(result: Text, item: Dict[str, Any]) -> Text:
+def _apply_flash(result: Text, item: Dict[str, Any], now: float) -> Text:
     """If flash is active, override style with flash background."""
-    if time.time() < item.get("_flash_until", 0):
+    if now < item.get("_flash_until", 0):
         bg = "on dark_green" if item.get("_flash_up") else "on dark_red"
         return Text(result.plain, style=f"bold white {bg}")
     return result
@@ -52,7 +60,8 @@ def _regular_close(item: Dict[str, Any]):
     return None
 
 
-def _cell_value(col_key: str, item: Dict[str, Any], state: DashboardState, large: bool = False):
+def _cell_value(col_key: str, item: Dict[str, Any], state: DashboardState, now: float,
+                large: bool = False):
     """Return the formatted cell value for a given column key and data item."""
     if col_key == "last":
         if not state.market_is_open:
@@ -74,25 +83,25 @@ def _cell_value(col_key: str, item: Dict[str, Any], state: DashboardState, large
             ext_chg, ext_pct, label = _get_ext_hours(item)
             if label is not None:
                 main_chg = item.get("regular_change") or item.get("change")
-                result = fmt_change(main_chg, large=large)
+                result = fmt_change(main_chg, large=large).copy()
                 ext_ann = fmt_ext_chg(ext_chg, large=large)
                 if ext_ann:
                     result.append_text(ext_ann)
-                return _apply_flash(result, item)
+                return _apply_flash(result, item, now)
         result = fmt_change(item.get("change"), large=large)
-        return _apply_flash(result, item)
+        return _apply_flash(result, item, now)
     elif col_key == "chg%":
         if not state.market_is_open:
             ext_chg, ext_pct, label = _get_ext_hours(item)
             if label is not None:
                 main_pct = item.get("regular_change_pct") or item.get("change_pct")
-                result = fmt_pct(main_pct)
+                result = fmt_pct(main_pct).copy()
                 ext_ann = fmt_ext_pct(ext_pct)
                 if ext_ann:
                     result.append_text(ext_ann)
-                return _apply_flash(result, item)
+                return _apply_flash(result, item, now)
         result = fmt_pct(item.get("change_pct"))
-        return _apply_flash(result, item)
+        return _apply_flash(result, item, now)
     elif col_key == "open_close":
         if state.market_is_open:
             return fmt_price(item.get("open"), large=large)
@@ -118,36 +127,54 @@ def _cell_value(col_key: str, item: Dict[str, Any], state: DashboardState, large
         if ytd_close and last:
             pct = ((last - ytd_close) / ytd_close) * 100
             return fmt_pct(pct)
-        return Text("—", style="dim")
+        return DASH
     return "—"
 
 
-def _build_market_table(items: List[Dict[str, Any]], col_keys: List[str],
-                        col_defs: dict, state: DashboardState,
-                        large: bool = False, symbol_width: int = 6) -> Table:
-    """Build a Rich Table from data items using the given column configuration.
+def _make_table(columns: tuple, show_header: bool = True) -> Table:
+    """Return a new Table with the given columns.
 
-    A symbol column (no header) is always prepended automatically.
+    `columns` is a tuple of (header, justify, min_width, style, no_wrap) tuples.
     """
-    table = Table(expand=True, box=None, padding=(0, 1))
+    table = Table(expand=True, box=None, padding=(0, 1), show_header=show_header)
+    for header, justify, min_width, style, no_wrap in columns:
+        table.add_column(header, justify=justify, min_width=min_width, style=style, no_wrap=no_wrap)
+    return table
+
 
-    # Symbol column — always first, no header
-    table.add_column("", justify="left", min_width=symbol_width, style="bold white")
+def _market_columns(col_keys: Sequence[str], col_defs: Mapping[str, tuple], state: DashboardState,
+                    symbol_width: int) -> tuple:
+    """Return (column spec for _make_table, valid column keys) for a market table.
 
+    A symbol column (no header) is always first.
+    """
+    columns = [("", "left", symbol_width, "bold white", False)]
     valid_keys = [key for key in col_keys if key in col_defs]
     for key in valid_keys:
         label, justify, min_width = col_defs[key]
         if key == "open_close":
             label = "Open" if state.market_is_open else "Close"
         style = "bold white" if justify == "left" else None
-        table.add_column(label, justify=justify, min_width=min_width, style=style)
+        columns.append((label, justify, min_width, style, False))
+    return tuple(columns), valid_keys
+
+
+def _build_market_table(items: List[Dict[str, Any]], col_keys: Sequence[str],
+                        col_defs: Mapping[str, tuple], state: DashboardState, now: float,
+                        large: bool = False, symbol_width: int = 6) -> Table:
+    """Build a Rich Table from data items using the given column configuration.
+
+    A symbol column (no header) is always prepended automatically.
+    """
+    columns, valid_keys = _market_columns(col_keys, col_defs, state, symbol_width)
+    table = _make_table(columns)
 
     if not items:
         table.add_row("—", *["—"] * len(valid_keys))
     else:
         for item in items:
-            symbol = item["ticker"].split(":", 1)[-1]
-            row = [symbol] + [_cell_value(k, item, state, large=large) for k in valid_keys]
+            symbol = _display_symbol(item["ticker"])
+            row = [symbol] + [_cell_value(k, item, state, now, large=large) for k in valid_keys]
             table.add_row(*row)
 
     return table
@@ -200,25 +227,15 @@ def _market_subtitle(freshness: str, state: DashboardState, streaming: bool = Fa
     return ", ".join(parts)
 
 
-def _build_grouped_equities_table(items: List[Dict[str, Any]], col_keys: List[str],
-                                   col_defs: dict, state: DashboardState,
-                                   equity_groups: list) -> Table:
+def _build_grouped_equities_table(items: List[Dict[str, Any]], col_keys: Sequence[str],
+                                   col_defs: Mapping[str, tuple], state: DashboardState, now: float,
+                                   equity_groups: tuple) -> Table:
     """Build an equities table with section dividers for named groups.
 
     A symbol column (no header) is always prepended automatically.
     """
-    table = Table(expand=True, box=None, padding=(0, 1))
-
-    # Symbol column — always first, no header
-    table.add_column("", justify="left", min_width=SYMBOL_MIN_WIDTH["equity"], style="bold white")
-
-    valid_keys = [key for key in col_keys if key in col_defs]
-    for key in valid_keys:
-        label, justify, min_width = col_defs[key]
-        if key == "open_close":
-            label = "Open" if state.market_is_open else "Close"
-        style = "bold white" if justify == "left" else None
-        table.add_column(label, justify=justify, min_width=min_width, style=style)
+    columns, valid_keys = _market_columns(col_keys, col_defs, state, SYMBOL_MIN_WIDTH["equity"])
+    table = _make_table(columns)
 
     num_cols = len(valid_keys) + 1  # +1 for symbol
     if not items:
@@ -244,8 +261,8 @@ def _build_grouped_equities_table(items: List[Dict[str, Any]], col_keys: List[st
                           *[""] * (num_cols - 1))
             current_group_idx = group_idx
 
-        symbol = item["ticker"].split(":", 1)[-1]
-        row = [symbol] + [_cell_value(k, item, state) for k in valid_keys]
+        symbol = _display_symbol(item["ticker"])
+        row = [symbol] + [_cell_value(k, item, state, now) for k in valid_keys]
         table.add_row(*row)
         row_count += 1
 
@@ -253,58 +270,68 @@ def _build_grouped_equities_table(items: List[Dict[str, Any]], col_keys: List[st
 
 
 def build_equities_table(state: DashboardState, config: Config, plans: PlanInfo,
-                         equity_groups: list = None) -> Panel:
+                         equity_groups: tuple = (), now: Optional[float] = None) -> Panel:
+    if now is None:
+        now = time.time()
     freshness = _data_freshness(plans.stocks)
     streaming = state.ws_connected and plans.stocks_has_ws
     subtitle = _market_subtitle(freshness, state, streaming=streaming)
 
     if equity_groups:
         table = _build_grouped_equities_table(state.equities, config.equity_cols,
-                                              EQUITY_COLUMNS, state, equity_groups)
+                                              EQUITY_COLUMNS, state, now, equity_groups)
     else:
-        table = _build_market_table(state.equities, config.equity_cols, EQUITY_COLUMNS, state,
+        table = _build_market_table(state.equities, config.equity_cols, EQUITY_COLUMNS, state, now,
                                     symbol_width=SYMBOL_MIN_WIDTH["equity"])
     return Panel(table, title="[bold grey70]EQUITIES[/bold grey70]", subtitle=f"[grey46]{subtitle}[/grey46]",
                  subtitle_align="right", border_style="grey70")
 
 
-def build_crypto_table(state: DashboardState, config: Config, plans: PlanInfo) -> Panel:
+def build_crypto_table(state: DashboardState, config: Config, plans: PlanInfo,
+                       now: Optional[float] = None) -> Panel:
+    if now is None:
+        now = time.time()
     freshness = _data_freshness(plans.currencies, market="crypto")
     if plans.currencies_has_snapshots:
         # Starter plan: real-time polling
         parts = [freshness]
         if state.crypto_updated:
-            ago = int(time.time() - state.crypto_updated)
+            ago = int(now - state.crypto_updated)
             parts.append(f"polled {ago}s ago" if ago < 60 else f"polled {ago // 60}m ago")
         subtitle = ", ".join(parts)
     else:
         # Basic plan: daily aggs — show the data date
         subtitle = state.crypto_data_date or freshness
 
-    table = _build_market_table(state.crypto, config.crypto_cols, CRYPTO_COLUMNS, state,
-                                    large=True, symbol_width=SYMBOL_MIN_WIDTH["crypto"])
+    table = _build_market_table(state.crypto, config.crypto_cols, CRYPTO_COLUMNS, state, now,
+                                large=True, symbol_width=SYMBOL_MIN_WIDTH["crypto"])
     return Panel(table, title="[bold grey70]CRYPTO[/bold grey70]", subtitle=f"[grey46]{subtitle}[/grey46]",
                  subtitle_align="right", border_style="grey70")
 
 
-def build_indices_table(state: DashboardState, config: Config, plans: PlanInfo) -> Panel:
+def build_indices_table(state: DashboardState, config: Config, plans: PlanInfo,
+                        now: Optional[float] = None) -> Panel:
+    if now is None:
+        now = time.time()
     freshness = _data_freshness(plans.indices)
     streaming = state.ws_connected and plans.indices_has_ws
     subtitle = _market_subtitle(freshness, state, streaming=streaming, show_extended=False)
 
-    table = _build_market_table(state.indices, config.index_cols, INDEX_COLUMNS, state,
-                                    large=True, symbol_width=SYMBOL_MIN_WIDTH["index"])
+    table = _build_market_table(state.indices, config.index_cols, INDEX_COLUMNS, state, now,
+                                large=True, symbol_width=SYMBOL_MIN_WIDTH["index"])
     return Panel(table, title="[bold grey70]INDICES[/bold grey70]", subtitle=f"[grey46]{subtitle}[/grey46]",
                  subtitle_align="right", border_style="grey70")
 
 
-def build_treasury_panel(state: DashboardState, watchlist: Dict[str, List[str]]) -> Panel:
+_TREASURY_COLUMNS = (("Maturity", "left", None, "bold white", True), ("Yield", "right", None, None, True))
+_ECONOMY_COLUMNS = (("Indicator", "left", None, "bold white", True), ("Value", "right", None, None, True))
+
+
+def build_treasury_panel(state: DashboardState, watchlist: Dict[str, tuple]) -> Panel:
     treas_date = state.treasury.get("date", "")
     yield_keys = watchlist.get("treasury") or DEFAULT_YIELD_KEYS
 
-    table = Table(expand=True, box=None, padding=(0, 1), show_header=False)
-    table.add_column("Maturity", style="bold white", no_wrap=True)
-    table.add_column("Yield", justify="right", no_wrap=True)
+    table = _make_table(_TREASURY_COLUMNS, show_header=False)
 
     for key in yield_keys:
         attr = ALL_YIELD_FIELDS.get(key.upper())
@@ -317,24 +344,22 @@ def build_treasury_panel(state: DashboardState, watchlist: Dict[str, List[str]])
                  subtitle_align="right", border_style="grey70")
 
 
-def build_economy_panel(state: DashboardState, watchlist: Dict[str, List[str]]) -> Panel:
+def build_economy_panel(state: DashboardState, watchlist: Dict[str, tuple]) -> Panel:
     labor_date = state.labor.get("date", "")
     inflation_date = state.inflation.get("date", "")
     date_str = labor_date or inflation_date or ""
     economy_keys = watchlist.get("economy") or DEFAULT_ECONOMY_KEYS
 
-    table = Table(expand=True, box=None, padding=(0, 1), show_header=False)
-    table.add_column("Indicator", style="bold white", no_wrap=True)
-    table.add_column("Value", justify="right", no_wrap=True)
+    table = _make_table(_ECONOMY_COLUMNS, show_header=False)
 
     def pct_or_dash(val):
-        return Text(f"{val:.1f}%", style="cyan") if val is not None else Text("—", style="dim")
+        return Text(f"{val:.1f}%", style="cyan") if val is not None else DASH
 
     def dollar_or_dash(val):
-        return Text(f"${val:,.2f}", style="cyan") if val is not None else Text("—", style="dim")
+        return Text(f"${val:,.2f}", style="cyan") if val is not None else DASH
 
     def num_or_dash(val):
-        return Text(f"{val:,.3f}", style="cyan") if val is not None else Text("—", style="dim")
+        return Text(f"{val:,.3f}", style="cyan") if val is not None else DASH
 
     formatters = {"pct": pct_or_dash, "dollar": dollar_or_dash, "num": num_or_dash}
 
@@ -354,8 +379,14 @@ def build_economy_panel(state: DashboardState, watchlist: Dict[str, List[str]])
                  subtitle_align="right", border_style="grey70")
 
 
-def make_header(state: DashboardState) -> Panel:
-    now = datetime.now().strftime("%H:%M:%S")
+@lru_cache(maxsize=1)
+def _clock_text(sec: int) -> str:
+    """HH:MM:SS for a whole epoch second; only reformatted when the second changes."""
+    return time.strftime("%H:%M:%S", time.localtime(sec))
+
+
+def make_header(state: DashboardState, now: Optional[float] = None) -> Panel:
+    clock = _clock_text(int(now if now is not None else time.time()))
 
     left = Text()
     if state.active_watchlist_name:
@@ -372,7 +403,7 @@ def make_header(state: DashboardState) -> Panel:
         else:
             left.append("    [rate limited]", style="bold red")
 
-    right = Text(f"{now}  [l] List  [q] Quit", style="dim")
+    right = Text(f"{clock}  [l] List  [q] Quit", style="dim")
 
     header_table = Table(expand=True, box=None, show_header=False, padding=0)
     header_table.add_column("left")
@@ -382,12 +413,54 @@ def make_header(state: DashboardState) -> Panel:
     return Panel(header_table, title="[bold grey70]FINTRA[/bold grey70]", border_style="grey70")
 
 
-def build_layout(state: DashboardState, watchlist: Dict[str, List[str]],
-                 config: Config, plans: PlanInfo) -> Layout:
-    layout = Layout()
+# Slow-moving panels (economy data changes daily): name → (inputs, Panel).
+# Rebuilt only when their inputs compare unequal to the cached ones.
+_panel_cache: Dict[str, Tuple[tuple, Panel]] = {}
+
+
+def _cached_panel(name: str, inputs: tuple, build, *args) -> Panel:
+    """Return the cached Panel for `name` if `inputs` are unchanged, else `build(*args)`."""
+    hit = _panel_cache.get(name)
+    if hit is not None and hit[0] == inputs:
+        return hit[1]
+    panel = build(*args)
+    _panel_cache[name] = (inputs, panel)
+    return panel
+
+
+# One Layout tree for the life of the app; build_layout resizes its regions and
+# swaps in the new panels instead of allocating a fresh tree every frame.
+_layout: Optional[Layout] = None
+
+
+def _dashboard_layout() -> Layout:
+    """Return the persistent dashboard Layout, creating its regions on first use."""
+    global _layout
+    if _layout is None:
+        _layout = Layout()
+        _layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="indices"),
+            Layout(name="equities"),
+            Layout(name="crypto"),
+            Layout(name="bottom"),
+        )
+        _layout["bottom"].split_row(
+            Layout(name="treasury"),
+            Layout(name="economy"),
+        )
+    return _layout
+
+
+def build_layout(state: DashboardState, watchlist: Dict[str, tuple],
+                 config: Config, plans: PlanInfo, now: Optional[float] = None) -> Layout:
+    """Update the dashboard layout. `now` is read once per frame and shared by every panel."""
+    if now is None:
+        now = time.time()
+    layout = _dashboard_layout()
 
     # Panel border = 2 rows (top+bottom), so content rows = size - 2
-    equity_groups = watchlist.get("equity_groups", [])
+    equity_groups = watchlist.get("equity_groups", ())
     eq_rows = max(len(state.equities), 1) + 1  # +1 for header row
     if equity_groups:
         grouped_tickers = {t for _, tickers in equity_groups for t in tickers}
@@ -403,34 +476,42 @@ def build_layout(state: DashboardState, watchlist: Dict[str, List[str]],
     economy_keys = watchlist.get("economy") or DEFAULT_ECONOMY_KEYS
     bottom_rows = max(len(yield_keys), len(economy_keys)) + 2  # +2 for panel border
 
-    layout.split_column(
-        Layout(name="header", size=3),
-        Layout(name="indices", size=ix_rows + 2),
-        Layout(name="equities", size=eq_rows + 2),
-        Layout(name="crypto", size=cr_rows + 2),
-        Layout(name="bottom", size=bottom_rows),
-    )
-
-    layout["header"].update(make_header(state))
-    layout["indices"].update(build_indices_table(state, config, plans))
-    layout["equities"].update(build_equities_table(state, config, plans, equity_groups))
-    layout["crypto"].update(build_crypto_table(state, config, plans))
-
-    bottom = Layout()
-    bottom.split_row(
-        Layout(name="treasury"),
-        Layout(name="economy"),
-    )
-    bottom["treasury"].update(build_treasury_panel(state, watchlist))
-    bottom["economy"].update(build_economy_panel(state, watchlist))
-    layout["bottom"].update(bottom)
+    layout["indices"].size = ix_rows + 2
+    layout["equities"].size = eq_rows + 2
+    layout["crypto"].size = cr_rows + 2
+    layout["bottom"].size = bottom_rows
+
+    layout["header"].update(make_header(state, now))
+    layout["indices"].update(build_indices_table(state, config, plans, now))
+    layout["equities"].update(build_equities_table(state, config, plans, equity_groups, now))
+    layout["crypto"].update(build_crypto_table(state, config, plans, now))
+    layout["treasury"].update(_cached_panel("treasury", (state.treasury, yield_keys),
+                                            build_treasury_panel, state, watchlist))
+    layout["economy"].update(_cached_panel("economy", (state.labor, state.inflation, economy_keys),
+                                           build_economy_panel, state, watchlist))
 
     return layout
 
 
+def refresh_clock(layout: Layout, state: DashboardState, config: Config, plans: PlanInfo,
+                  now: float) -> None:
+    """Once-a-second update of the time-dependent regions of an already built layout.
+
+    Redraws the header clock and, on plans that poll crypto, the "polled Ns ago" subtitle;
+    everything else only changes when `state.version` moves and the layout is rebuilt.
+    """
+    layout["header"].update(make_header(state, now))
+    if plans.currencies_has_snapshots and state.crypto_updated:
+        layout["crypto"].update(build_crypto_table(state, config, plans, now))
+
+
 def key_listener(state: DashboardState):
-    """Background thread that listens for 'q' to quit."""
+    """Background thread that listens for 'q' to quit (or 'l' to switch watchlist).
+
+    Quits as well if the terminal closes under it.
+    """
     try:
+        import select
         import tty
         import termios
 
@@ -439,12 +520,28 @@ def key_listener(state: DashboardState):
         try:
             tty.setcbreak(fd)
             while not state.quit_flag:
-                ch = sys.stdin.read(1)
-                if ch in ("q", "Q"):
+                # Sleep in select() so the thread notices quit_flag even with no input;
+                # raw os.read avoids sys.stdin's buffer hiding keys from select()
+                ready, _, _ = select.select([fd], [], [], 0.5)
+                if not ready:
+                    continue
+                try:
+                    keys = os.read(fd, 32)
+                except OSError:
+                    keys = b""  # EIO once the terminal hangs up
+                if not keys:
+                    # Terminal closed: nothing can press q anymore, so quit
                     state.quit_flag = True
-                    break
-                elif ch in ("l", "L"):
-                    state.switch_watchlist = True
+                    state.dirty.set()
+                    return
+                for ch in keys.decode(errors="ignore"):
+                    if ch in ("q", "Q"):
+                        state.quit_flag = True
+                        state.dirty.set()
+                        return
+                    elif ch in ("l", "L"):
+                        state.switch_watchlist = True
+                        state.dirty.set()
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     except Exception:
@@ -1,7 +1,9 @@
+import asyncio
 import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from fintra.data import compute_change
 from fintra.plans import PlanInfo
 from fintra.state import DashboardState
 
@@ -18,143 +20,214 @@ def _set_connected(label: str, connected: bool, state: DashboardState):
         else:
             _connected_feeds.discard(label)
         state.ws_connected = bool(_connected_feeds)
+    state.bump()
+
+
+# All feeds share one asyncio event loop on a single background thread
+_ws_loop: Optional[asyncio.AbstractEventLoop] = None
+_ws_loop_lock = threading.Lock()
+
+
+def _get_ws_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared WS event loop, starting its thread on first use."""
+    global _ws_loop
+    with _ws_loop_lock:
+        if _ws_loop is None:
+            _ws_loop = asyncio.new_event_loop()
+            threading.Thread(target=_ws_loop.run_forever, name="fintra-ws", daemon=True).start()
+        return _ws_loop
 
 
 class WsFeedHandle:
     """Handle for a WebSocket feed with automatic reconnection."""
 
-    def __init__(self):
+    def __init__(self, market: str, subscriptions: List[str]):
+        self.market = market
+        self.subscriptions = subscriptions  # channel list, reused on reconnect
+        self._feed = None  # current WsFeed, only touched on the WS loop
         self._stopped = False
-        self._current_feed = None
-        self._lock = threading.Lock()
+        self._future = None  # concurrent Future for the feed's reconnect task
 
-    def set_feed(self, feed):
-        with self._lock:
-            self._current_feed = feed
+    def start(self, coro):
+        self._future = asyncio.run_coroutine_threadsafe(coro, _get_ws_loop())
 
     @property
     def stopped(self):
         return self._stopped
 
+    def set_subscriptions(self, subscriptions: List[str]):
+        """Swap the channel list; an open connection changes only the difference."""
+        _get_ws_loop().call_soon_threadsafe(self._apply_subscriptions, subscriptions)
+
+    def _apply_subscriptions(self, subscriptions: List[str]):
+        # Runs on the WS loop, so it can't interleave with feed creation
+        self.subscriptions = subscriptions
+        if self._feed is not None:
+            self._feed.resubscribe(subscriptions)
+
     def close(self):
+        """Stop reconnecting; cancelling the task closes the open connection."""
         self._stopped = True
-        with self._lock:
-            if self._current_feed:
-                try:
-                    self._current_feed.close()
-                except Exception:
-                    pass
+        if self._future is not None:
+            self._future.cancel()
+
+
+def _update_ticker(index: Dict[str, Dict[str, Any]], ticker: str, last: float,
+                   prev_closes: Dict[str, float], now: Optional[float] = None, **extra):
+    """Update a ticker dict in place with new price data.
+
+    `index` maps ticker → row dict (e.g. `state.equities_by_ticker`); the row is
+    shared with the section list, so the table builders see the change directly.
+    """
+    item = index.get(ticker)
+    if item is None:
+        return False
+    old_change = item.get("change")
+    item["last"] = last
+    prev = prev_closes.get(ticker)
+    if prev:
+        item["change"], item["change_pct"] = compute_change(last, prev)
+    if old_change is not None and item.get("change") != old_change:
+        item["_flash_until"] = (now if now is not None else time.time()) + 1.0
+        item["_flash_up"] = (item["change"] - old_change) > 0
+    # high/low only ever widen the session range; other extras overwrite
+    for k, v in extra.items():
+        if v is None:
+            continue
+        if k == "high":
+            cur = item.get("high")
+            if cur is None or v > cur:
+                item["high"] = v
+        elif k == "low":
+            cur = item.get("low")
+            if cur is None or v < cur:
+                item["low"] = v
+        else:
+            item[k] = v
+    return True
+
+
+def _apply_updates(index: Dict[str, Dict[str, Any]], updates: List[Tuple[str, float, Dict]],
+                   prev_closes: Dict[str, float], now: float) -> bool:
+    """Apply one WS batch of (ticker, price, extras) updates. Returns True if any row changed."""
+    updated = False
+    for ticker, price, extras in updates:
+        if _update_ticker(index, ticker, price, prev_closes, now, **extras):
+            updated = True
+    return updated
+
+
+def _section_updater(state: DashboardState, section: str):
+    """Build the on_updates callback that applies WS batches to one section's rows.
+
+    The batch is applied under `state.lock` so renders never snapshot it half-done.
+    """
+    index_attr = f"{section}_by_ticker"
 
+    def _on_updates(updates):
+        now = time.time()
+        with state.lock:
+            updated = _apply_updates(getattr(state, index_attr), updates, state.prev_closes, now)
+            if updated:
+                state.market_updated = now
+                state.flash_until = now + 1.0
+        if updated:
+            state.bump()
 
-def _update_ticker(items: List[Dict[str, Any]], ticker: str, last: float,
-                   prev_closes: Dict[str, float], **extra):
-    """Update a ticker dict in a list with new price data."""
-    for item in items:
-        if item["ticker"] == ticker:
-            old_change = item.get("change")
-            item["last"] = last
-            prev = prev_closes.get(ticker)
-            if prev:
-                item["change"] = last - prev
-                item["change_pct"] = (item["change"] / prev) * 100
-            if old_change is not None and item.get("change") != old_change:
-                item["_flash_until"] = time.time() + 1.0
-                item["_flash_up"] = (item["change"] - old_change) > 0
-            for k, v in extra.items():
-                if v is not None:
-                    if k in ("high",) and item.get(k) is not None:
-                        item[k] = max(item[k], v)
-                    elif k in ("low",) and item.get(k) is not None:
-                        item[k] = min(item[k], v)
-                    else:
-                        item[k] = v
-            return True
-    return False
-
-
-def _run_feed_with_reconnect(handle, provider, market, feed_type, tickers,
-                              on_update, state, label):
+    return _on_updates
+
+
+async def _run_feed_with_reconnect(handle, provider, market, feed_type,
+                                    on_updates, state, label):
     """Run a WS feed, reconnecting automatically on disconnect with backoff."""
     backoff = 1
     max_backoff = 60
     while not handle.stopped and not state.quit_flag:
+        feed = None
         try:
-            feed = provider.create_ws_feed(market, feed_type, tickers, on_update)
-            handle.set_feed(feed)
-            if handle.stopped:
-                try:
-                    feed.close()
-                except Exception:
-                    pass
-                return
+            feed = handle._feed = provider.create_ws_feed(market, feed_type, handle.subscriptions, on_updates)
             _set_connected(label, True, state)
             backoff = 1  # reset on successful connection
-            feed.run()
+            await feed.run()
         except Exception:
             pass
         finally:
+            handle._feed = None
             _set_connected(label, False, state)
-            handle.set_feed(None)
-        # Backoff before reconnecting (check stop flag frequently)
-        for _ in range(int(backoff * 2)):
-            if handle.stopped or state.quit_flag:
-                return
-            time.sleep(0.5)
+            if feed is not None:
+                try:
+                    await feed.close()
+                except Exception:
+                    pass
+        # Backoff before reconnecting; handle.close() cancels the sleep
+        await asyncio.sleep(backoff)
         backoff = min(backoff * 2, max_backoff)
 
 
-def start_ws_feeds(provider, watchlist: Dict[str, List[str]],
+# WS-capable sections: (market / connection label, watchlist section)
+_WS_SECTIONS = (("stocks", "equities"), ("indices", "indices"), ("crypto", "crypto"))
+
+
+def _wanted_feeds(watchlist: Dict[str, tuple], plans: PlanInfo) -> Dict[str, Tuple[str, str]]:
+    """market → (feed_type, section) for each non-empty section the plans allow a feed for."""
+    allowed = {
+        # Stocks/indices feeds — only if plan supports WebSockets (Starter+)
+        "stocks": (plans.stocks_has_ws, "realtime" if plans.stocks_realtime else "delayed"),
+        "indices": (plans.indices_has_ws, "realtime" if plans.indices_realtime else "delayed"),
+        # Crypto feed — only if Currencies Starter
+        "crypto": (plans.currencies_has_ws, "realtime"),
+    }
+    wanted = {}
+    for market, section in _WS_SECTIONS:
+        has_ws, feed_type = allowed[market]
+        if watchlist[section] and has_ws:
+            wanted[market] = (feed_type, section)
+    return wanted
+
+
+def _start_feed(provider, market: str, feed_type: str, section: str, tickers: List[str],
+                state: DashboardState) -> WsFeedHandle:
+    handle = WsFeedHandle(market, provider.ws_subscriptions(market, tickers))
+    handle.start(_run_feed_with_reconnect(handle, provider, market, feed_type,
+                                          _section_updater(state, section), state, market))
+    return handle
+
+
+def start_ws_feeds(provider, watchlist: Dict[str, tuple],
                    state: DashboardState, plans: PlanInfo) -> List[WsFeedHandle]:
-    """Start WebSocket feeds with automatic reconnection in background threads.
+    """Start WebSocket feeds with automatic reconnection on the shared WS event loop.
 
     Returns list of WsFeedHandle instances so they can be closed later.
     Only starts WS feeds for plans that support WebSockets.
     """
-    handles: List[WsFeedHandle] = []
+    return [_start_feed(provider, market, feed_type, section, watchlist[section], state)
+            for market, (feed_type, section) in _wanted_feeds(watchlist, plans).items()]
 
-    # Stocks feed — only if plan supports WebSockets (Starter+)
-    if watchlist["equities"] and plans.stocks_has_ws:
-        feed_type = "realtime" if plans.stocks_realtime else "delayed"
-
-        def _on_stock(ticker, price, extras):
-            _update_ticker(state.equities, ticker, price, state.prev_closes, **extras)
-            state.market_updated = time.time()
-
-        handle = WsFeedHandle()
-        handles.append(handle)
-        threading.Thread(target=_run_feed_with_reconnect,
-                        args=(handle, provider, "stocks", feed_type,
-                              watchlist["equities"], _on_stock, state, "stocks"),
-                        daemon=True).start()
-
-    # Indices feed — only if plan supports WebSockets (Starter+)
-    if watchlist["indices"] and plans.indices_has_ws:
-        feed_type = "realtime" if plans.indices_realtime else "delayed"
-
-        def _on_index(ticker, price, extras):
-            _update_ticker(state.indices, ticker, price, state.prev_closes, **extras)
-            state.market_updated = time.time()
-
-        handle = WsFeedHandle()
-        handles.append(handle)
-        threading.Thread(target=_run_feed_with_reconnect,
-                        args=(handle, provider, "indices", feed_type,
-                              watchlist["indices"], _on_index, state, "indices"),
-                        daemon=True).start()
-
-    # Crypto feed — only if Currencies Starter
-    if watchlist["crypto"] and plans.currencies_has_ws:
-        def _on_crypto(ticker, price, extras):
-            _update_ticker(state.crypto, ticker, price, state.prev_closes, **extras)
-            state.market_updated = time.time()
-
-        handle = WsFeedHandle()
-        handles.append(handle)
-        threading.Thread(target=_run_feed_with_reconnect,
-                        args=(handle, provider, "crypto", "realtime",
-                              watchlist["crypto"], _on_crypto, state, "crypto"),
-                        daemon=True).start()
 
+def retarget_ws_feeds(feeds: List[WsFeedHandle], provider, watchlist: Dict[str, tuple],
+                      state: DashboardState, plans: PlanInfo) -> List[WsFeedHandle]:
+    """Point running feeds at a new watchlist without reconnecting.
+
+    A feed whose market still has tickers keeps its connection and only
+    subscribes/unsubscribes the difference; one whose market is now empty is
+    closed, and a market that gained tickers gets a new feed. Returns [] if no
+    feeds were running, leaving it to the caller to start them.
+    """
+    if not feeds:
+        return []
+    wanted = _wanted_feeds(watchlist, plans)
+    handles: List[WsFeedHandle] = []
+    for handle in feeds:
+        if handle.market in wanted:
+            _, section = wanted[handle.market]
+            handle.set_subscriptions(provider.ws_subscriptions(handle.market, watchlist[section]))
+            handles.append(handle)
+        else:
+            handle.close()
+    running = {h.market for h in handles}
+    for market, (feed_type, section) in wanted.items():
+        if market not in running:
+            handles.append(_start_feed(provider, market, feed_type, section, watchlist[section], state))
     return handles
 
 